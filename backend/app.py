@@ -1,24 +1,129 @@
-from flask import Flask, jsonify, request, session
-from flask_cors import CORS
+from flask import Blueprint, Flask, Response, current_app, g, jsonify, request, stream_with_context
 from model import db, User, Plants, Species, Care_Events
+from queries import (dashboard_plants, user_plants, update_care_summary, owned_plant_ids, insert_care_events,
+                     user_owns_plant, care_history_query, watering_schedule, mark_schedule_dirty,
+                     has_other_owner, add_plant_owner, remove_plant_owner, joined_before, plant_owners_query,
+                     create_plants, delete_plants)
+from serializers import json_response
+from stats import care_stats
+from db_pool import env_flag, engine_options, install_statement_timeout, pool_stats
+from metrics import RequestMetrics
+from user_cache import UserCache
+from species_cache import SpeciesCatalog
+from species_search import search_species
+from care_buffer import CareEventBuffer
+from db_routing import replica_router, read_only
+from row_counts import CountCache, exact_counts, estimated_counts
+from passwords import DEFAULT_POOL_SIZE
 from datetime import datetime, date
-from flask_migrate import Migrate
 import os
-import bcrypt
 import jwt
+import json
 import datetime
 from functools import wraps
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import IntegrityError
 
-app = Flask(__name__)
+CORS_ORIGINS = ["https://the-plant-parenthood-planner.vercel.app", "http://localhost:3000"]
 
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db').replace('postgres://', 'postgresql://')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-very-secret-key-here-for-jwt')
+api = Blueprint('api', __name__)
 
-db.init_app(app)
-migrate = Migrate(app, db)
+request_metrics = RequestMetrics()
+user_cache = UserCache()
+species_catalog = SpeciesCatalog()
+care_event_buffer = CareEventBuffer()
+count_cache = CountCache()
 
-CORS(app, origins=["https://the-plant-parenthood-planner.vercel.app", "http://localhost:3000"])
+
+def load_config(config, environ):
+    config['SQLALCHEMY_DATABASE_URI'] = environ.get('DATABASE_URL', 'sqlite:///app.db').replace('postgres://', 'postgresql://')
+    config['SQLALCHEMY_REPLICA_URIS'] = [uri.strip().replace('postgres://', 'postgresql://')
+                                         for uri in environ.get('DATABASE_REPLICA_URLS', '').split(',') if uri.strip()]
+    config['REPLICA_STICKY_SECONDS'] = float(environ.get('REPLICA_STICKY_SECONDS', 5))
+    config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(environ, config['SQLALCHEMY_DATABASE_URI'])
+    config['DB_STATEMENT_TIMEOUT_MS'] = int(environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+    config['SLOW_QUERY_MS'] = int(environ.get('SLOW_QUERY_MS', 250))
+    config['SECRET_KEY'] = environ.get('SECRET_KEY', 'your-very-secret-key-here-for-jwt')
+    config['BCRYPT_LOG_ROUNDS'] = int(environ.get('BCRYPT_LOG_ROUNDS', 12))
+    config['BCRYPT_POOL_SIZE'] = int(environ.get('BCRYPT_POOL_SIZE', DEFAULT_POOL_SIZE))
+    config['CARE_EVENT_BATCH_LIMIT'] = int(environ.get('CARE_EVENT_BATCH_LIMIT', 1000))
+    config['PLANT_BATCH_LIMIT'] = int(environ.get('PLANT_BATCH_LIMIT', 1000))
+    config['CARE_EVENT_PAGE_LIMIT'] = int(environ.get('CARE_EVENT_PAGE_LIMIT', 200))
+    config['PLANT_OWNER_PAGE_LIMIT'] = int(environ.get('PLANT_OWNER_PAGE_LIMIT', 200))
+    config['CARE_EVENT_WRITE_BEHIND'] = env_flag(environ, 'CARE_EVENT_WRITE_BEHIND', False)
+    config['CARE_EVENT_FLUSH_SIZE'] = int(environ.get('CARE_EVENT_FLUSH_SIZE', 500))
+    config['CARE_EVENT_FLUSH_MS'] = int(environ.get('CARE_EVENT_FLUSH_MS', 50))
+    config['SPECIES_CACHE_TTL'] = int(environ.get('SPECIES_CACHE_TTL', 30))
+    config['SPECIES_MAX_AGE'] = int(environ.get('SPECIES_MAX_AGE', 60))
+    config['USER_CACHE_TTL'] = int(environ.get('USER_CACHE_TTL', 60))
+    config['USER_CACHE_SIZE'] = int(environ.get('USER_CACHE_SIZE', 1024))
+    config['CHECK_DATA_COUNT_MODE'] = environ.get('CHECK_DATA_COUNT_MODE', 'cached')
+    config['CHECK_DATA_CACHE_TTL'] = int(environ.get('CHECK_DATA_CACHE_TTL', 30))
+
+
+def create_app(config=None):
+    """Build the Flask app without touching the database (engines connect lazily on first query).
+
+    The caches, metrics, replica router and care event buffer are module-level singletons, so only one app
+    per process is supported: each call re-points them at the newest app. Entry points should either call
+    this once or share the default app via `from app import app`.
+    """
+    from flask_cors import CORS
+
+    app = Flask(__name__)
+    load_config(app.config, os.environ)
+    app.config.update(config or {})
+    if 'SQLALCHEMY_ENGINE_OPTIONS' not in (config or {}):
+        # Pool options follow the final database URI, which `config` may override
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(os.environ, app.config['SQLALCHEMY_DATABASE_URI'])
+
+    db.init_app(app)
+    with app.app_context():
+        install_statement_timeout(db.engine, app.config['DB_STATEMENT_TIMEOUT_MS'])
+        request_metrics.init_app(app, db.engine)
+
+    def make_replica_engine(uri):
+        engine = create_engine(uri, **engine_options(os.environ, uri))
+        install_statement_timeout(engine, app.config['DB_STATEMENT_TIMEOUT_MS'])
+        request_metrics.instrument_engine(engine)
+        return engine
+
+    replica_router.init_app(app, make_replica_engine)
+
+    user_cache.init_app(app)
+    species_catalog.init_app(app)
+    care_event_buffer.init_app(app)
+    count_cache.init_app(app)
+
+    CORS(app, origins=CORS_ORIGINS)
+
+    # Migration tooling (alembic) is only needed for `flask db ...`; the flask CLI loads it anyway
+    if os.environ.get('FLASK_RUN_FROM_CLI') == 'true':
+        from flask_migrate import Migrate
+        Migrate(app, db)
+
+    app.register_blueprint(api)
+    return app
+
+
+_default_app = None
+
+
+def __getattr__(name):
+    # `from app import app` (scripts, gunicorn app:app, FLASK_APP=app) builds the default app on first use
+    global _default_app
+    if name == 'app':
+        if _default_app is None:
+            _default_app = create_app()
+        return _default_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def invalidate_cached_user(mapper, connection, target):
+    user_cache.invalidate(target.id)
 
 # JWT Functions
 def create_jwt_token(user_id):
@@ -27,17 +132,41 @@ def create_jwt_token(user_id):
         'exp': datetime.datetime.utcnow() + datetime.timedelta(days=7),
         'iat': datetime.datetime.utcnow()
     }
-    return jwt.encode(payload, app.config['SECRET_KEY'], algorithm='HS256')
+    return jwt.encode(payload, current_app.config['SECRET_KEY'], algorithm='HS256')
 
-def verify_jwt_token(token):
+def decode_jwt_token(token, secret_key=None):
     try:
-        payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
-        return payload['user_id']
+        return jwt.decode(token, secret_key or current_app.config['SECRET_KEY'], algorithms=['HS256'])
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
 
+def is_id(value):
+    # bool is an int subclass; True must not pass for plant 1
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def verify_jwt_token(token):
+    payload = decode_jwt_token(token)
+    return payload['user_id'] if payload else None
+
+def load_jwt_user(payload):
+    # Known before the first query so the replica router can keep recent writers
+    # and freshly issued tokens on the primary
+    g.user_id = payload['user_id']
+    g.token_issued_at = payload.get('iat')
+    user = user_cache.get(payload['user_id'], payload.get('iat'))
+    if user is None and replica_router.retry_on_primary():
+        # A lagging replica may not have the user yet
+        user = user_cache.get(payload['user_id'], payload.get('iat'))
+    return user
+
+def resolve_jwt_user(token):
+    payload = decode_jwt_token(token)
+    if not payload or not payload.get('user_id'):
+        return None
+    return load_jwt_user(payload)
+
 # JWT Decorator for protected routes
 def jwt_required(f):
     @wraps(f)
@@ -48,11 +177,11 @@ def jwt_required(f):
         
         try:
             token = token[7:]  # Remove 'Bearer ' prefix
-            user_id = verify_jwt_token(token)
-            if not user_id:
+            payload = decode_jwt_token(token)
+            if not payload or not payload.get('user_id'):
                 return jsonify({"message": "Invalid token"}), 401
             
-            user = User.query.get(user_id)
+            user = load_jwt_user(payload)
             if not user:
                 return jsonify({"message": "User not found"}), 401
                 
@@ -62,22 +191,47 @@ def jwt_required(f):
     
     return decorated
 
-@app.route('/check-data', methods=['GET'])
+@api.route('/check-data', methods=['GET'])
+@read_only
 def check_data():
     try:
-        users_count = User.query.count()
-        species_count = Species.query.count()
-        plants_count = Plants.query.count()
+        # ?mode=exact for real COUNT(*)s; the default serves cached counts so uptime probes stay cheap
+        mode = request.args.get('mode', current_app.config['CHECK_DATA_COUNT_MODE'])
+        if mode not in ('cached', 'estimate', 'exact'):
+            return jsonify({"message": "mode must be one of cached, estimate, exact"}), 400
         
-        return jsonify({
-            'users_count': users_count,
-            'species_count': species_count,
-            'plants_count': plants_count,
-        }), 200
+        counts, age = None, 0
+        if mode == 'estimate':
+            counts = estimated_counts()
+            if counts is None:
+                mode = 'cached'
+        if mode == 'cached':
+            counts, age = count_cache.get()
+        if mode == 'exact':
+            counts = exact_counts()
+        
+        return jsonify({**counts, 'mode': mode, 'age_seconds': round(age, 1)}), 200
     except Exception as e:
         return jsonify({"message": "Error checking data", "error": str(e)}), 500
 
-@app.route('/')
+@api.route('/pool-stats', methods=['GET'])
+def get_pool_stats():
+    stats = pool_stats(db.engine)
+    if replica_router.engines:
+        stats['replicas'] = [pool_stats(engine) for engine in replica_router.engines]
+    return jsonify(stats), 200
+
+@api.route('/metrics', methods=['GET'])
+def get_metrics():
+    gauges = {f'user_cache_{key}': value for key, value in user_cache.stats().items()}
+    if care_event_buffer.enabled:
+        gauges.update({f'care_event_buffer_{key}': value for key, value in care_event_buffer.stats().items()})
+    if replica_router.engines:
+        gauges.update({f'db_router_{key}': value for key, value in replica_router.stats().items()})
+    gauges.update({f'db_pool_{key}': value for key, value in pool_stats(db.engine).items() if key != 'pool_class'})
+    return Response(request_metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+
+@api.route('/')
 def home():
     return jsonify({
         "message": "Welcome to Plant Parenthood Planner API",
@@ -85,7 +239,7 @@ def home():
         "version": "jwt-authentication"
     })
 
-@app.route('/register', methods=['POST'])
+@api.route('/register', methods=['POST'])
 def register():
     try:
         data = request.get_json()
@@ -104,6 +258,8 @@ def register():
         
         db.session.add(user)
         db.session.commit()
+        # No JWT yet, so tell the replica router whose write this was
+        g.user_id = user.id
 
         # Create JWT token for new user
         token = create_jwt_token(user.id)
@@ -116,7 +272,7 @@ def register():
     except Exception as e:
         return jsonify({"message": "Error creating user", "error": str(e)}), 500
 
-@app.route('/login', methods=['POST'])
+@api.route('/login', methods=['POST'])
 def login():
     try:
         data = request.get_json()
@@ -127,6 +283,11 @@ def login():
         user = User.query.filter_by(username=data['username']).first()
         
         if user and user.check_password(data['password']):
+            if user.password_needs_rehash():
+                user.set_password(data['password'])
+                db.session.commit()
+                g.user_id = user.id
+            
             token = create_jwt_token(user.id)
             return jsonify({
                 "message": "Login successful",
@@ -138,81 +299,80 @@ def login():
     except Exception as e:
         return jsonify({"message": "Error during login", "error": str(e)}), 500
 
-@app.route('/logout', methods=['POST'])
+@api.route('/logout', methods=['POST'])
 @jwt_required
 def logout(user):
     # With JWT, logout is handled on the client side by removing the token
     return jsonify({"message": "Logged out successfully"}), 200
 
-@app.route('/check-auth', methods=['GET'])
+@api.route('/check-auth', methods=['GET'])
+@read_only
 def check_auth():
     token = request.headers.get('Authorization')
     if token and token.startswith('Bearer '):
         token = token[7:]
-        user_id = verify_jwt_token(token)
-        if user_id:
-            user = User.query.get(user_id)
-            if user:
-                return jsonify({
-                    "authenticated": True,
-                    "user": user.to_dict()
-                }), 200
+        user = resolve_jwt_user(token)
+        if user:
+            return jsonify({
+                "authenticated": True,
+                "user": user.to_dict()
+            }), 200
     
     return jsonify({"authenticated": False}), 200
 
 # Protected routes with JWT
-@app.route('/dashboard', methods=['GET'])
+@api.route('/dashboard', methods=['GET'])
+@read_only
 @jwt_required
 def user_dashboard(user):
     try:
-        plants_data = []
+        plants_data = dashboard_plants(user.id)
+        if care_event_buffer.enabled:
+            care_event_buffer.apply_pending(plants_data)
         
-        for plant in user.plants:
-            last_care = Care_Events.query.filter_by(plant_id=plant.id)\
-                          .order_by(Care_Events.event_date.desc()).first()
-            
-            species_info = None
-            if plant.species:
-                species_info = {
-                    'id': plant.species.id,
-                    'common_name': plant.species.common_name,
-                    'scientific_name': plant.species.scientific_name,
-                    'watering_frequency': plant.species.watering_frequency
-                }
-            
-            plant_info = {
-                'id': plant.id,
-                'nickname': plant.nickname,
-                'species_id': plant.species_id,
-                'species': species_info,
-                'last_care_date': last_care.event_date.isoformat() if last_care else None,
-                'last_care_type': last_care.event_type if last_care else None
-            }
-            
-            plants_data.append(plant_info)
-        
-        return jsonify({
+        return json_response({
             'user': user.to_dict(),
             'plants': plants_data,
             'plants_count': len(plants_data)
-        }), 200
+        }, 200)
     except Exception as e:
         return jsonify({"message": "Error loading dashboard", "error": str(e)}), 500
 
-@app.route('/plants', methods=['GET'])
+@api.route('/schedule', methods=['GET'])
+@read_only
+@jwt_required
+def get_schedule(user):
+    try:
+        statuses = [status for status in request.args.get('status', '').split(',') if status]
+        schedule = watering_schedule(user.id, date.today(), statuses)
+        return json_response({'schedule': schedule, 'count': len(schedule)}, 200)
+    except Exception as e:
+        return jsonify({"message": "Error computing schedule", "error": str(e)}), 500
+
+@api.route('/stats', methods=['GET'])
+@read_only
+@jwt_required
+def get_stats(user):
+    try:
+        return json_response(care_stats(user.id, date.today()), 200)
+    except Exception as e:
+        return jsonify({"message": "Error computing stats", "error": str(e)}), 500
+
+@api.route('/plants', methods=['GET'])
+@read_only
 @jwt_required
 def get_plants(user):
     try:
-        plants = user.plants
+        plants = user_plants(user.id)
         
         if not plants:
             return jsonify({"message": "User has no plants", "plants": []}), 200
 
-        return jsonify([plant.to_dict() for plant in plants]), 200
+        return json_response(plants, 200)
     except Exception as e:
         return jsonify({"message": "Error retrieving plants", "error": str(e)}), 500
 
-@app.route('/plants', methods=['POST'])
+@api.route('/plants', methods=['POST'])
 @jwt_required
 def create_plant(user):
     try:
@@ -229,7 +389,8 @@ def create_plant(user):
         db.session.add(plant)
         db.session.flush()
         
-        plant.users.append(user)
+        plant.users.append(user.model)
+        mark_schedule_dirty([plant.id])
         
         db.session.commit()
         return jsonify(plant.to_dict()), 201
@@ -237,7 +398,7 @@ def create_plant(user):
         db.session.rollback()
         return jsonify({"message": "Error creating plant", "error": str(e)}), 500
 
-@app.route('/plants/<int:plant_id>/care_events', methods=['POST'])
+@api.route('/plants/<int:plant_id>/care_events', methods=['POST'])
 @jwt_required
 def add_care_event(user, plant_id):
     try:
@@ -246,47 +407,355 @@ def add_care_event(user, plant_id):
         if not data or 'event_type' not in data:
             return jsonify({"message": "Event type is required"}), 400
         
+        if not user_owns_plant(user.id, plant_id):
+            return jsonify({"message": "Not authorized to add care events to this plant"}), 403
+        
+        if care_event_buffer.enabled:
+            row = {
+                'event_type': data['event_type'],
+                'event_date': date.today(),
+                'user_id': user.id,
+                'plant_id': plant_id,
+                'notes': data.get('notes', '')
+            }
+            care_event_buffer.submit(row)
+            # Accepted, not yet committed: the id is assigned when the writer flushes its batch
+            return jsonify({**row, 'id': None, 'event_date': row['event_date'].isoformat()}), 202
+        
         care_event = Care_Events(
             event_type=data['event_type'],
-            event_date=datetime.now().date(),
+            event_date=date.today(),
             user_id=user.id,
             plant_id=plant_id,
             notes=data.get('notes', '')
         )
         
         db.session.add(care_event)
+        update_care_summary(plant_id, care_event.event_date, care_event.event_type)
+        mark_schedule_dirty([plant_id])
         db.session.commit()
         return jsonify(care_event.to_dict()), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({"message": "Error adding care event", "error": str(e)}), 500
 
-@app.route('/plants/<int:id>', methods=['DELETE'])
+def parse_care_cursor(cursor):
+    event_date, _, event_id = cursor.partition(':')
+    return date.fromisoformat(event_date), int(event_id)
+
+@api.route('/plants/<int:plant_id>/care_events', methods=['GET'])
+@jwt_required
+def get_care_events(user, plant_id):
+    try:
+        if not user_owns_plant(user.id, plant_id):
+            return jsonify({"message": "Not authorized to view this plant"}), 403
+        
+        try:
+            before = parse_care_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        except ValueError:
+            return jsonify({"message": "Invalid cursor"}), 400
+        
+        stmt = care_history_query(plant_id, before)
+        
+        if request.args.get('format') == 'ndjson':
+            # Server-side cursor: rows are fetched and written in chunks, never all held at once
+            def generate():
+                for care_event in db.session.scalars(stmt.execution_options(yield_per=500)):
+                    yield json.dumps(care_event.to_dict()) + '\n'
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
+        limit = max(1, min(request.args.get('limit', 50, type=int), current_app.config['CARE_EVENT_PAGE_LIMIT']))
+        care_events = db.session.scalars(stmt.limit(limit + 1)).all()
+        
+        next_cursor = None
+        if len(care_events) > limit:
+            care_events = care_events[:limit]
+            last = care_events[-1]
+            next_cursor = f"{last.event_date.isoformat()}:{last.id}"
+        
+        return jsonify({
+            'care_events': [care_event.to_dict() for care_event in care_events],
+            'next_cursor': next_cursor
+        }), 200
+    except Exception as e:
+        return jsonify({"message": "Error retrieving care events", "error": str(e)}), 500
+
+@api.route('/care_events/batch', methods=['POST'])
+@jwt_required
+def add_care_events_batch(user):
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('events'), list) or not data['events']:
+            return jsonify({"message": "A non-empty events list is required"}), 400
+        
+        events = data['events']
+        if len(events) > current_app.config['CARE_EVENT_BATCH_LIMIT']:
+            return jsonify({"message": f"At most {current_app.config['CARE_EVENT_BATCH_LIMIT']} events per batch"}), 413
+        
+        plant_ids = {event.get('plant_id') for event in events if isinstance(event, dict) and is_id(event.get('plant_id'))}
+        owned = owned_plant_ids(user.id, plant_ids)
+        
+        results = []
+        rows = []
+        for index, event in enumerate(events):
+            if (not isinstance(event, dict) or not isinstance(event.get('event_type'), str) or not event['event_type']
+                    or not is_id(event.get('plant_id'))):
+                results.append({"index": index, "status": 400, "message": "plant_id and event_type are required"})
+                continue
+            if len(event['event_type']) > 50:
+                results.append({"index": index, "status": 400, "message": "event_type must be at most 50 characters"})
+                continue
+            if not isinstance(event.get('notes', ''), (str, type(None))):
+                results.append({"index": index, "status": 400, "message": "notes must be a string"})
+                continue
+            if event['plant_id'] not in owned:
+                results.append({"index": index, "status": 403, "message": "Not authorized for this plant"})
+                continue
+            try:
+                event_date = date.fromisoformat(event['event_date']) if event.get('event_date') else date.today()
+            except (TypeError, ValueError):
+                results.append({"index": index, "status": 400, "message": "event_date must be YYYY-MM-DD"})
+                continue
+            
+            results.append({"index": index, "status": 201})
+            rows.append({
+                'event_type': event['event_type'],
+                'event_date': event_date,
+                'user_id': user.id,
+                'plant_id': event['plant_id'],
+                'notes': event.get('notes', '')
+            })
+        
+        created = [result for result in results if result['status'] == 201]
+        for result, event_id in zip(created, insert_care_events(rows)):
+            result['id'] = event_id
+        mark_schedule_dirty(row['plant_id'] for row in rows)
+        
+        db.session.commit()
+        
+        status = 201 if len(created) == len(events) else 207 if created else 400
+        return jsonify({"created": len(created), "results": results}), status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"message": "Error adding care events", "error": str(e)}), 500
+
+@api.route('/plants/<int:id>', methods=['DELETE'])
 @jwt_required
 def delete_plant(user, id):
     try:
-        plant = Plants.query.get_or_404(id)
+        if db.session.get(Plants, id) is None:
+            return jsonify({"message": "Plant not found"}), 404
         
-        if user not in plant.users:
+        if not user_owns_plant(user.id, id):
             return jsonify({"message": "Not authorized to delete this plant"}), 403
-            
-        db.session.delete(plant)
+        
+        if care_event_buffer.enabled:
+            care_event_buffer.flush()
+        delete_plants([id])
         db.session.commit()
         return jsonify({"message": "Plant deleted successfully"}), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({"message": "Error deleting plant", "error": str(e)}), 500
 
+@api.route('/plants/batch', methods=['POST'])
+@jwt_required
+def create_plants_batch(user):
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('plants'), list) or not data['plants']:
+            return jsonify({"message": "A non-empty plants list is required"}), 400
+        
+        plants = data['plants']
+        if len(plants) > current_app.config['PLANT_BATCH_LIMIT']:
+            return jsonify({"message": f"At most {current_app.config['PLANT_BATCH_LIMIT']} plants per batch"}), 413
+        
+        species_ids = {plant.get('species_id') for plant in plants
+                       if isinstance(plant, dict) and isinstance(plant.get('species_id'), int)}
+        known_species = set(db.session.scalars(select(Species.id).where(Species.id.in_(species_ids))))
+        
+        results = []
+        rows = []
+        for index, plant in enumerate(plants):
+            if (not isinstance(plant, dict) or not isinstance(plant.get('nickname'), str) or not plant['nickname']
+                    or not isinstance(plant.get('species_id'), int)):
+                results.append({"index": index, "status": 400, "message": "Nickname and species_id are required"})
+                continue
+            if len(plant['nickname']) > 40:
+                results.append({"index": index, "status": 400, "message": "Nickname must be at most 40 characters"})
+                continue
+            if plant['species_id'] not in known_species:
+                results.append({"index": index, "status": 404, "message": "Species not found"})
+                continue
+            
+            results.append({"index": index, "status": 201})
+            rows.append({'nickname': plant['nickname'], 'species_id': plant['species_id']})
+        
+        created = [result for result in results if result['status'] == 201]
+        for result, plant_id in zip(created, create_plants(user.id, rows)):
+            result['id'] = plant_id
+        
+        db.session.commit()
+        
+        status = 201 if len(created) == len(plants) else 207 if created else 400
+        return jsonify({"created": len(created), "results": results}), status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"message": "Error creating plants", "error": str(e)}), 500
+
+@api.route('/plants/batch', methods=['DELETE'])
+@jwt_required
+def delete_plants_batch(user):
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('plant_ids'), list) or not data['plant_ids']:
+            return jsonify({"message": "A non-empty plant_ids list is required"}), 400
+        
+        plant_ids = data['plant_ids']
+        if len(plant_ids) > current_app.config['PLANT_BATCH_LIMIT']:
+            return jsonify({"message": f"At most {current_app.config['PLANT_BATCH_LIMIT']} plants per batch"}), 413
+        
+        requested = {plant_id for plant_id in plant_ids if isinstance(plant_id, int)}
+        owned = owned_plant_ids(user.id, requested)
+        existing = owned | set(db.session.scalars(
+            select(Plants.id).where(Plants.id.in_(requested - owned))
+        ))
+        
+        results = []
+        deleted = set()
+        for index, plant_id in enumerate(plant_ids):
+            if not isinstance(plant_id, int):
+                results.append({"index": index, "status": 400, "message": "plant_id must be an integer"})
+            elif plant_id in deleted:
+                results.append({"index": index, "id": plant_id, "status": 400, "message": "Duplicate plant_id"})
+            elif plant_id not in existing:
+                results.append({"index": index, "id": plant_id, "status": 404, "message": "Plant not found"})
+            elif plant_id not in owned:
+                results.append({"index": index, "id": plant_id, "status": 403, "message": "Not authorized to delete this plant"})
+            else:
+                results.append({"index": index, "id": plant_id, "status": 200})
+                deleted.add(plant_id)
+        
+        if care_event_buffer.enabled and deleted:
+            care_event_buffer.flush()
+        delete_plants(deleted)
+        db.session.commit()
+        
+        status = 200 if len(deleted) == len(plant_ids) else 207 if deleted else 400
+        return jsonify({"deleted": len(deleted), "results": results}), status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"message": "Error deleting plants", "error": str(e)}), 500
+
+@api.route('/plants/<int:plant_id>/owners', methods=['GET'])
+@jwt_required
+def get_plant_owners(user, plant_id):
+    try:
+        if not user_owns_plant(user.id, plant_id):
+            return jsonify({"message": "Not authorized to view this plant"}), 403
+        
+        after = request.args.get('cursor', type=int)
+        limit = max(1, min(request.args.get('limit', 50, type=int), current_app.config['PLANT_OWNER_PAGE_LIMIT']))
+        owners = db.session.execute(plant_owners_query(plant_id, after).limit(limit + 1)).all()
+        
+        next_cursor = None
+        if len(owners) > limit:
+            owners = owners[:limit]
+            next_cursor = owners[-1].id
+        
+        return jsonify({
+            'owners': [{'id': owner.id, 'username': owner.username} for owner in owners],
+            'next_cursor': next_cursor
+        }), 200
+    except Exception as e:
+        return jsonify({"message": "Error retrieving plant owners", "error": str(e)}), 500
+
+@api.route('/plants/<int:plant_id>/owners', methods=['POST'])
+@jwt_required
+def share_plant(user, plant_id):
+    try:
+        data = request.get_json()
+        
+        if not data or 'username' not in data:
+            return jsonify({"message": "Username is required"}), 400
+        
+        if not user_owns_plant(user.id, plant_id):
+            return jsonify({"message": "Not authorized to share this plant"}), 403
+        
+        target = User.query.filter_by(username=data['username']).first()
+        if not target:
+            return jsonify({"message": "User not found"}), 404
+        
+        if not add_plant_owner(plant_id, target.id):
+            return jsonify({"message": "Plant is already shared with this user"}), 200
+        
+        mark_schedule_dirty([plant_id])
+        db.session.commit()
+        return jsonify({
+            "message": "Plant shared successfully",
+            "owner": {'id': target.id, 'username': target.username}
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"message": "Error sharing plant", "error": str(e)}), 500
+
+@api.route('/plants/<int:plant_id>/owners/<int:owner_id>', methods=['DELETE'])
+@jwt_required
+def unshare_plant(user, plant_id, owner_id):
+    try:
+        if not user_owns_plant(user.id, plant_id):
+            return jsonify({"message": "Not authorized to unshare this plant"}), 403
+        
+        if owner_id != user.id and not user_owns_plant(owner_id, plant_id):
+            return jsonify({"message": "User does not own this plant"}), 404
+        
+        # Anyone may leave; removing someone else needs seniority, so a sharee can't evict the
+        # plant's creator or whoever shared it with them
+        if owner_id != user.id and not joined_before(plant_id, user.id, owner_id):
+            return jsonify({"message": "Only owners added before this user can remove them"}), 403
+        
+        if not has_other_owner(plant_id, owner_id):
+            return jsonify({"message": "Cannot remove the last owner; delete the plant instead"}), 409
+        
+        remove_plant_owner(plant_id, owner_id)
+        mark_schedule_dirty([plant_id])
+        db.session.commit()
+        return jsonify({"message": "Plant unshared successfully"}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"message": "Error unsharing plant", "error": str(e)}), 500
+
 # Public routes (no JWT required)
-@app.route('/species', methods=['GET'])
+def cached_json_response(entry):
+    body, etag = entry
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f"public, max-age={current_app.config['SPECIES_MAX_AGE']}"
+    return response.make_conditional(request)
+
+@api.route('/species', methods=['GET'])
+@read_only
 def get_all_species():
     try:
-        species = Species.query.all()
-        return jsonify([specie.to_dict() for specie in species]), 200
+        return cached_json_response(species_catalog.catalog())
     except Exception as e:
         return jsonify({"message": "Error retrieving species", "error": str(e)}), 500
 
-@app.route('/species', methods=['POST'])
+@api.route('/species/search', methods=['GET'])
+@read_only
+def search_species_route():
+    try:
+        q = request.args.get('q', '')
+        limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+        return json_response(search_species(q, limit), 200)
+    except Exception as e:
+        return jsonify({"message": "Error searching species", "error": str(e)}), 500
+
+@api.route('/species', methods=['POST'])
 def create_species():
     try:
         data = request.get_json()
@@ -307,20 +776,29 @@ def create_species():
         
         db.session.add(species)
         db.session.commit()
+        species_catalog.invalidate()
         return jsonify(species.to_dict()), 201
+    except IntegrityError:
+        # Lost a race with a concurrent create; the unique index on scientific_name caught it
+        db.session.rollback()
+        return jsonify({"message": "Species with this scientific name already exists"}), 409
     except Exception as e:
         db.session.rollback()
         return jsonify({"message": "Error creating species", "error": str(e)}), 500
 
-@app.route('/species/<int:id>', methods=['GET'])
+@api.route('/species/<int:id>', methods=['GET'])
+@read_only
 def get_species(id):
     try:
-        species = Species.query.get_or_404(id)
-        return jsonify(species.to_dict()), 200
+        entry = species_catalog.item(id)
+        if entry is None:
+            return jsonify({"message": "Species not found"}), 404
+        return cached_json_response(entry)
     except Exception as e:
         return jsonify({"message": "Species not found", "error": str(e)}), 404
 
 if __name__ == '__main__':
+    app = create_app()
     with app.app_context():
         db.create_all()
     app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""ASGI entry point: the read-heavy endpoints run on async SQLAlchemy sessions, everything else falls through to Flask.
+
+Run with: uvicorn asgi:app --workers 1
+"""
+import os
+from contextlib import asynccontextmanager
+from functools import wraps
+from a2wsgi import WSGIMiddleware
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.routing import Route, Mount
+from app import app as flask_app, CORS_ORIGINS, decode_jwt_token, user_cache, care_event_buffer
+from model import User
+from queries import user_plants_query, dashboard_query, species_query
+from serializers import dumps, plant_row_dict, dashboard_row_dict, species_row_dict
+from species_cache import SpeciesCatalog, version_query, catalog_version
+from user_cache import owned_plants_query, user_payload
+from db_pool import async_database_uri, async_engine_options, install_statement_timeout
+
+secret_key = flask_app.config['SECRET_KEY']
+database_uri = flask_app.config['SQLALCHEMY_DATABASE_URI']
+engine = create_async_engine(async_database_uri(database_uri), **async_engine_options(os.environ, database_uri))
+install_statement_timeout(engine.sync_engine, flask_app.config['DB_STATEMENT_TIMEOUT_MS'])
+Session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+class AsyncSpeciesCatalog(SpeciesCatalog):
+    """SpeciesCatalog refreshed through an AsyncSession; species created via Flask show up within `ttl`."""
+
+    async def refresh(self, session):
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        version = catalog_version(*(await session.execute(version_query())).one())
+        snapshot = self._matching_snapshot(version)
+        if snapshot is None:
+            snapshot = self._build([species_row_dict(row) for row in await session.execute(species_query())])
+        return self._store(version, snapshot)
+
+
+species_catalog = AsyncSpeciesCatalog(ttl=flask_app.config['SPECIES_CACHE_TTL'])
+
+
+def json_response(payload, status=200):
+    return Response(dumps(payload), status_code=status, media_type='application/json')
+
+
+def cached_json_response(request, entry):
+    body, etag = entry
+    headers = {'ETag': f'"{etag}"', 'Cache-Control': f"public, max-age={flask_app.config['SPECIES_MAX_AGE']}"}
+    if_none_match = request.headers.get('if-none-match', '')
+    tags = [tag.strip().removeprefix('W/').strip('"') for tag in if_none_match.split(',')]
+    if etag in tags or '*' in tags:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+async def load_user(session, payload):
+    # Shares the Flask process's UserCache, so its invalidation listeners apply here too
+    user = user_cache.lookup(payload['user_id'], payload.get('iat'))
+    if user:
+        return user
+    model = await session.get(User, payload['user_id'])
+    return user_cache.store(model, payload.get('iat')) if model else None
+
+
+def jwt_required(f):
+    @wraps(f)
+    async def decorated(request):
+        token = request.headers.get('Authorization')
+        if not token or not token.startswith('Bearer '):
+            return json_response({"message": "Token is missing"}, 401)
+
+        payload = decode_jwt_token(token[7:], secret_key)
+        if not payload or not payload.get('user_id'):
+            return json_response({"message": "Invalid token"}, 401)
+
+        async with Session() as session:
+            try:
+                user = await load_user(session, payload)
+            except Exception:
+                return json_response({"message": "Token is invalid"}, 401)
+            if not user:
+                return json_response({"message": "User not found"}, 401)
+            return await f(request, session, user)
+
+    return decorated
+
+
+async def check_auth(request):
+    token = request.headers.get('Authorization')
+    if token and token.startswith('Bearer '):
+        payload = decode_jwt_token(token[7:], secret_key)
+        if payload and payload.get('user_id'):
+            async with Session() as session:
+                user = await load_user(session, payload)
+                if user:
+                    plants = await session.execute(owned_plants_query(user.id))
+                    return json_response({"authenticated": True, "user": user_payload(user, plants)})
+
+    return json_response({"authenticated": False})
+
+
+@jwt_required
+async def user_dashboard(request, session, user):
+    try:
+        rows = (await session.execute(dashboard_query(user.id))).all()
+        plants_data = [dashboard_row_dict(row) for row in rows]
+        if care_event_buffer.enabled:
+            care_event_buffer.apply_pending(plants_data)
+
+        # The dashboard rows already carry id/nickname, so the user's plant list needs no second query
+        return json_response({
+            'user': user_payload(user, rows),
+            'plants': plants_data,
+            'plants_count': len(plants_data)
+        })
+    except Exception as e:
+        return json_response({"message": "Error loading dashboard", "error": str(e)}, 500)
+
+
+@jwt_required
+async def get_plants(request, session, user):
+    try:
+        plants = [plant_row_dict(row) for row in await session.execute(user_plants_query(user.id))]
+
+        if not plants:
+            return json_response({"message": "User has no plants", "plants": []})
+
+        return json_response(plants)
+    except Exception as e:
+        return json_response({"message": "Error retrieving plants", "error": str(e)}, 500)
+
+
+async def get_all_species(request):
+    try:
+        async with Session() as session:
+            catalog, _ = await species_catalog.refresh(session)
+        return cached_json_response(request, catalog)
+    except Exception as e:
+        return json_response({"message": "Error retrieving species", "error": str(e)}, 500)
+
+
+async def get_species(request):
+    try:
+        async with Session() as session:
+            _, items = await species_catalog.refresh(session)
+        entry = items.get(request.path_params['id'])
+        if entry is None:
+            return json_response({"message": "Species not found"}, 404)
+        return cached_json_response(request, entry)
+    except Exception as e:
+        return json_response({"message": "Species not found", "error": str(e)}, 404)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await engine.dispose()
+
+
+app = Starlette(
+    routes=[
+        Route('/check-auth', check_auth, methods=['GET']),
+        Route('/dashboard', user_dashboard, methods=['GET']),
+        Route('/plants', get_plants, methods=['GET']),
+        Route('/species', get_all_species, methods=['GET']),
+        Route('/species/{id:int}', get_species, methods=['GET']),
+        # Writes, auth and the remaining reads keep running on the sync Flask app in a thread pool
+        Mount('/', app=WSGIMiddleware(flask_app)),
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=CORS_ORIGINS, allow_methods=['*'], allow_headers=['*'])],
+    lifespan=lifespan
+)
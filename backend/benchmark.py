@@ -0,0 +1,561 @@
+import argparse
+import http.client
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'plant_bench.db'))
+
+from app import create_app
+from flask import current_app, jsonify
+from sqlalchemy import create_engine, insert, func, select
+from model import db, User, Plants, Species, Care_Events, Care_Summary, plant_owner
+from queries import user_plants, dashboard_plants
+from species_cache import SpeciesCatalog
+from serializers import json_response
+from db_pool import pool_stats
+from db_routing import replica_router
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_concurrent(request_fn, total, concurrency, client_factory=None):
+    latencies = []
+    lock = threading.Lock()
+    remaining = [total]
+    # Worker threads have no app context of their own
+    app = current_app._get_current_object()
+
+    def worker():
+        client = client_factory() if client_factory else app.test_client()
+        while True:
+            with lock:
+                if remaining[0] == 0:
+                    return
+                remaining[0] -= 1
+            started = time.perf_counter()
+            request_fn(client)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    return {
+        'requests': total,
+        'concurrency': concurrency,
+        'throughput_rps': round(total / wall, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2)
+    }
+
+
+def ensure_user(username, password='password123'):
+    user = User.query.filter_by(username=username).first()
+    if not user:
+        user = User(username=username, email=f'{username}@bench.local')
+        user.set_password(password)
+        db.session.add(user)
+        db.session.commit()
+    return user
+
+
+def ensure_plants(user, count):
+    plants = list(user.plants)
+    for i in range(len(plants), count):
+        plant = Plants(nickname=f'bench plant {i}')
+        plant.users.append(user)
+        db.session.add(plant)
+        plants.append(plant)
+    db.session.commit()
+    return [plant.id for plant in plants[:count]]
+
+
+def auth_headers(username, password='password123'):
+    response = current_app.test_client().post('/login', json={'username': username, 'password': password})
+    return {'Authorization': 'Bearer ' + response.get_json()['token']}
+
+
+def bench_login(args):
+    ensure_user('bench_user')
+
+    def login(client):
+        response = client.post('/login', json={'username': 'bench_user', 'password': 'password123'})
+        assert response.status_code == 200, response.get_json()
+
+    return run_concurrent(login, args.requests, args.concurrency)
+
+
+def bench_care_events(args):
+    plant_ids = ensure_plants(ensure_user('bench_user'), 50)
+    headers = auth_headers('bench_user')
+    events = [{'plant_id': plant_ids[i % len(plant_ids)], 'event_type': 'watering'}
+              for i in range(args.batch_size)]
+
+    def single(client):
+        for event in events:
+            response = client.post(f"/plants/{event['plant_id']}/care_events", json=event, headers=headers)
+            assert response.status_code == 201, response.get_json()
+
+    def batch(client):
+        response = client.post('/care_events/batch', json={'events': events}, headers=headers)
+        assert response.status_code == 201, response.get_json()
+
+    results = {}
+    for name, request_fn in (('single', single), ('batch', batch)):
+        result = run_concurrent(request_fn, args.requests, args.concurrency)
+        result['events_per_sec'] = round(result['throughput_rps'] * args.batch_size, 1)
+        results[name] = result
+    return results
+
+
+SYLLABLES = ['mon', 'ste', 'ra', 'phi', 'lo', 'den', 'dron', 'cal', 'the', 'a', 'fi', 'cus', 'spa', 'thi',
+             'phyl', 'lum', 'dra', 'cae', 'na', 'pe', 'ro', 'mi', 'ho', 'ya', 'zam', 'io', 'cul', 'cas',
+             'aglo', 'ne', 'ma', 'ant', 'hu', 'rium', 'be', 'go', 'nia', 'cro', 'ton', 'dief', 'fen', 'bach',
+             'ia', 'epi', 'prem', 'num', 'mar', 'an', 'sci', 'ndap', 'sus', 'tra', 'des', 'can', 'tia', 'hoy',
+             'pi', 'lea', 'sen', 'ecio', 'kal', 'an', 'cho', 'e', 'ver', 'ia', 'gas', 'te', 'ria', 'haw',
+             'or', 'thia', 'sed', 'um', 'cras', 'sula', 'ech', 'eve', 'ri', 'al', 'oe', 'yuc', 'ca', 'ox']
+
+
+def random_name(rng, words):
+    return ' '.join(
+        ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize() for _ in range(words)
+    )
+
+
+def ensure_species(count):
+    existing = db.session.scalar(func.count(Species.id))
+    rng = random.Random(existing)
+    rows = [{
+        'common_name': random_name(rng, 2)[:40],
+        'scientific_name': f'{random_name(rng, 2)} {existing + i}'[:40],
+        'watering_frequency': rng.choice(['Weekly', 'Every 1-2 weeks', 'Every 2-3 weeks', 'Monthly'])
+    } for i in range(max(0, count - existing))]
+    for start in range(0, len(rows), 10000):
+        db.session.execute(insert(Species), rows[start:start + 10000])
+    db.session.commit()
+
+
+def bench_species_search(args):
+    ensure_species(args.species)
+    rng = random.Random(1)
+    queries = []
+    for _ in range(50):
+        word = random_name(rng, 1).lower()
+        queries.append(word[:3])                                   # prefix
+        queries.append(word[:2] + word[3:] if len(word) > 4 else word)  # dropped letter
+
+    def search(client):
+        response = client.get('/species/search', query_string={'q': rng.choice(queries), 'limit': 20})
+        assert response.status_code == 200, response.get_json()
+
+    result = run_concurrent(search, args.requests, args.concurrency)
+    result['species'] = args.species
+    return result
+
+
+def timed(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return {'p50_ms': round(percentile(samples, 50) * 1000, 3), 'p99_ms': round(percentile(samples, 99) * 1000, 3)}
+
+
+def bench_serializers(args):
+    # Micro-benchmark of payload building only: ORM hydration + to_dict + jsonify vs Core rows + json_response
+    user = ensure_user('bench_user')
+    ensure_plants(user, args.plants)
+    ensure_species(args.species)
+    user_id = user.id
+
+    def orm_plants():
+        db.session.expire_all()
+        jsonify([plant.to_dict() for plant in db.session.get(User, user_id).plants])
+
+    def orm_dashboard():
+        db.session.expire_all()
+        plants = []
+        for plant in db.session.get(User, user_id).plants:
+            info = plant.to_dict()
+            summary = db.session.get(Care_Summary, plant.id)
+            info['last_care_date'] = summary.last_care_date.isoformat() if summary else None
+            info['last_care_type'] = summary.last_care_type if summary else None
+            plants.append(info)
+        jsonify({'plants': plants, 'plants_count': len(plants)})
+
+    def core_dashboard():
+        plants = dashboard_plants(user_id)
+        json_response({'plants': plants, 'plants_count': len(plants)})
+
+    def orm_species():
+        db.session.expire_all()
+        jsonify([specie.to_dict() for specie in Species.query.all()])
+
+    def core_species():
+        SpeciesCatalog(ttl=0).catalog()
+
+    with current_app.test_request_context():
+        return {
+            'plants': {'orm': timed(orm_plants, args.requests), 'core': timed(lambda: json_response(user_plants(user_id)), args.requests)},
+            'dashboard': {'orm': timed(orm_dashboard, args.requests), 'core': timed(core_dashboard, args.requests)},
+            'species': {'orm': timed(orm_species, args.requests), 'core': timed(core_species, args.requests)}
+        }
+
+
+def ensure_care_events(user, plant_ids, count):
+    existing = db.session.scalar(func.count(Care_Events.id))
+    rng = random.Random(existing)
+    start = date.today() - timedelta(days=3 * 365)
+    for offset in range(existing, count, 50000):
+        rows = [{
+            'event_type': 'watering' if rng.random() < 0.8 else 'fertilizing',
+            'event_date': start + timedelta(days=rng.randrange(3 * 365)),
+            'user_id': user.id,
+            'plant_id': rng.choice(plant_ids),
+            'notes': ''
+        } for _ in range(min(50000, count - offset))]
+        db.session.execute(insert(Care_Events), rows)
+        db.session.commit()
+
+
+def bench_stats(args):
+    user = ensure_user('bench_user')
+    plant_ids = ensure_plants(user, args.plants)
+    ensure_care_events(user, plant_ids, args.events)
+    headers = auth_headers('bench_user')
+
+    def stats(client):
+        response = client.get('/stats', headers=headers)
+        assert response.status_code == 200, response.get_json()
+
+    result = run_concurrent(stats, args.requests, args.concurrency)
+    result['events'] = args.events
+    return result
+
+
+def bench_pool(args):
+    # Concurrency above pool_size + max_overflow shows up as checkout wait rather than errors
+    user = ensure_user('bench_user')
+    ensure_plants(user, args.plants)
+    headers = auth_headers('bench_user')
+
+    def plants(client):
+        response = client.get('/plants', headers=headers)
+        assert response.status_code == 200, response.get_json()
+
+    result = run_concurrent(plants, args.requests, args.concurrency)
+    result['pool'] = pool_stats(db.engine)
+    return result
+
+
+def bench_api(args):
+    # Drives the main endpoints as a sample of generated users (see generate_data.py)
+    rng = random.Random(7)
+    users = db.session.execute(
+        select(User.id, User.username).order_by(func.random()).limit(args.users)
+    ).all()
+    owned = {}
+    for user_id, plant_id in db.session.execute(
+        select(plant_owner.c.user_id, plant_owner.c.plant_id)
+            .where(plant_owner.c.user_id.in_([user.id for user in users]))
+    ):
+        owned.setdefault(user_id, []).append(plant_id)
+
+    sessions = [(auth_headers(user.username, args.password), owned[user.id]) for user in users if user.id in owned]
+    assert sessions, 'No users with plants; run generate_data.py first'
+
+    def login(client):
+        user = rng.choice(users)
+        response = client.post('/login', json={'username': user.username, 'password': args.password})
+        assert response.status_code == 200, response.get_json()
+
+    def get(path, auth=True):
+        def request_fn(client):
+            headers, _ = rng.choice(sessions)
+            response = client.get(path, headers=headers if auth else None)
+            assert response.status_code == 200, response.get_json()
+        return request_fn
+
+    def care_event(client):
+        headers, plant_ids = rng.choice(sessions)
+        response = client.post(f'/plants/{rng.choice(plant_ids)}/care_events',
+                               json={'event_type': 'watering'}, headers=headers)
+        assert response.status_code in (201, 202), response.get_json()
+
+    endpoints = {
+        'login': login,
+        'dashboard': get('/dashboard'),
+        'plants': get('/plants'),
+        'species': get('/species', auth=False),
+        'care_event': care_event,
+    }
+    return {name: run_concurrent(request_fn, args.requests, args.concurrency)
+            for name, request_fn in endpoints.items()}
+
+
+def bench_write_behind(args):
+    # Same single-event endpoint with one commit per request vs. the write-behind group commit
+    from app import care_event_buffer
+    user = ensure_user('bench_user')
+    plant_ids = ensure_plants(user, args.plants)
+    headers = auth_headers('bench_user')
+    rng = random.Random(11)
+
+    def care_event(client):
+        response = client.post(f'/plants/{rng.choice(plant_ids)}/care_events',
+                               json={'event_type': 'watering'}, headers=headers)
+        assert response.status_code in (201, 202), response.get_json()
+
+    results = {'off': run_concurrent(care_event, args.requests, args.concurrency)}
+
+    buffer = care_event_buffer
+    buffer.enabled, buffer.max_batch = True, args.batch_size
+    try:
+        started = time.perf_counter()
+        results['on'] = run_concurrent(care_event, args.requests, args.concurrency)
+        buffer.flush()
+        # Accepted-per-second flatters the buffer; this one counts until the last batch is committed
+        results['on']['durable_events_per_second'] = round(args.requests / (time.perf_counter() - started), 1)
+        results['on']['buffer'] = buffer.stats()
+    finally:
+        buffer.enabled = False
+        buffer.close()
+    return results
+
+
+def bench_replicas(args):
+    # 10:1-ish read/write mix; writers' follow-up reads should land on the primary, the rest on replicas
+    sessions = []
+    for i in range(min(args.users, 20)):
+        user = ensure_user(f'bench_user{i}')
+        sessions.append((auth_headers(user.username), ensure_plants(user, 5)))
+
+    if not replica_router.engines:
+        url = db.engine.url
+        assert url.get_backend_name() == 'sqlite', 'Set DATABASE_REPLICA_URLS for non-SQLite benchmarks'
+        # Local stand-in for a replica: a point-in-time copy of the primary file
+        replica_path = url.database + '.replica'
+        with sqlite3.connect(url.database) as source, sqlite3.connect(replica_path) as target:
+            source.backup(target)
+        replica_router.set_replicas([create_engine(f'sqlite:///{replica_path}')])
+    else:
+        replica_router.set_replicas(replica_router.engines)  # reset the counters
+
+    rng = random.Random(13)
+    paths = ['/dashboard', '/plants', '/species', '/check-auth', '/check-data']
+
+    def request_fn(client):
+        headers, plant_ids = rng.choice(sessions)
+        if rng.random() < args.write_ratio:
+            response = client.post(f'/plants/{rng.choice(plant_ids)}/care_events',
+                                   json={'event_type': 'watering'}, headers=headers)
+            assert response.status_code in (201, 202), response.get_json()
+        else:
+            response = client.get(rng.choice(paths), headers=headers)
+            assert response.status_code == 200, response.get_json()
+
+    result = run_concurrent(request_fn, args.requests, args.concurrency)
+    result['router'] = replica_router.stats()
+    return result
+
+
+STARTUP_PROBE = '''
+import json, time
+started = time.perf_counter()
+import app as app_module
+imported = time.perf_counter()
+application = app_module.create_app()
+created = time.perf_counter()
+client = application.test_client()
+assert client.get('/').status_code == 200
+first = time.perf_counter()
+assert client.get('/species').status_code == 200
+first_db = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'first_response_ms': (first - started) * 1000,
+    'first_db_response_ms': (first_db - started) * 1000,
+}))
+'''
+
+
+def bench_startup(args):
+    # Fresh interpreter per run; process_ms also counts interpreter start-up before `import app`
+    runs = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', STARTUP_PROBE], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        run = json.loads(output.strip().splitlines()[-1])
+        run['process_ms'] = (time.perf_counter() - started) * 1000
+        runs.append(run)
+
+    return {key: {'p50_ms': round(percentile([run[key] for run in runs], 50), 1),
+                  'max_ms': round(max(run[key] for run in runs), 1)}
+            for key in runs[0]} | {'runs': args.runs}
+
+
+class HttpClient:
+    """Just enough of the test client interface to drive a real server over HTTP."""
+
+    def __init__(self, port):
+        self.port = port
+
+    def get(self, path, headers=None):
+        # A fresh connection per request: the Werkzeug server speaks HTTP/1.0 and closes anyway
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        try:
+            conn.request('GET', path, headers=headers or {})
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        finally:
+            conn.close()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(command, port):
+    process = subprocess.Popen(command, cwd=os.path.dirname(os.path.abspath(__file__)),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Server did not start: {' '.join(command)}")
+
+
+def bench_asgi(args):
+    # Same endpoints over real sockets: threaded Werkzeug (WSGI) vs. one uvicorn worker (ASGI)
+    user = ensure_user('bench_user')
+    ensure_plants(user, args.plants)
+    ensure_species(min(args.species, 1000))
+    headers = auth_headers('bench_user')
+
+    servers = {
+        'wsgi': lambda port: [sys.executable, '-m', 'flask', '--app', 'app', 'run', '--port', str(port), '--with-threads'],
+        'asgi': lambda port: [sys.executable, '-m', 'uvicorn', 'asgi:app', '--port', str(port), '--log-level', 'warning'],
+    }
+    paths = {'dashboard': '/dashboard', 'plants': '/plants', 'species': '/species', 'check_auth': '/check-auth'}
+
+    results = {}
+    for name, command in servers.items():
+        port = free_port()
+        process = start_server(command(port), port)
+        try:
+            results[name] = {}
+            for endpoint, path in paths.items():
+                def request_fn(client, path=path):
+                    status = client.get(path, headers=headers)
+                    assert status == 200, status
+                results[name][endpoint] = run_concurrent(request_fn, args.requests, args.concurrency,
+                                                         client_factory=lambda: HttpClient(port))
+        finally:
+            process.terminate()
+            process.wait()
+    return results
+
+
+SCENARIOS = {
+    'login': bench_login,
+    'care_events': bench_care_events,
+    'species_search': bench_species_search,
+    'serializers': bench_serializers,
+    'stats': bench_stats,
+    'pool': bench_pool,
+    'api': bench_api,
+    'asgi': bench_asgi,
+    'write_behind': bench_write_behind,
+    'startup': bench_startup,
+    'replicas': bench_replicas,
+}
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(result, baseline, path=''):
+    # Walk both result trees and print p50/p99/throughput changes side by side
+    for key, value in result.items():
+        if isinstance(value, dict):
+            compare(value, baseline.get(key) or {}, f'{path}{key}.')
+        elif key in ('p50_ms', 'p99_ms', 'throughput_rps') and isinstance(baseline.get(key), (int, float)) and baseline[key]:
+            change = (value - baseline[key]) / baseline[key] * 100
+            print(f"{path}{key}: {baseline[key]} -> {value} ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Plant Parenthood API endpoints')
+    parser.add_argument('scenario', choices=sorted(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--species', type=int, default=100000)
+    parser.add_argument('--plants', type=int, default=200)
+    parser.add_argument('--events', type=int, default=10000000)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--password', default='password123')
+    parser.add_argument('--write-ratio', type=float, default=0.1, help='Share of writes in the replicas scenario')
+    parser.add_argument('--runs', type=int, default=10, help='Fresh processes for the startup scenario')
+    parser.add_argument('--output', help='Write results as JSON to this path')
+    parser.add_argument('--compare', help='Previous JSON results to compare against')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        result = SCENARIOS[args.scenario](args)
+
+    print(f"{args.scenario}: {json.dumps(result, indent=2)}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f)['result'])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'scenario': args.scenario,
+                'commit': current_commit(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'database': app.config['SQLALCHEMY_DATABASE_URI'].split('@')[-1],
+                'args': vars(args),
+                'result': result
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from sqlalchemy import select
+from model import db, Plants
+from queries import insert_care_events, mark_schedule_dirty
+
+logger = logging.getLogger('plant_parenthood.care_buffer')
+
+_STOP = object()
+
+
+class CareEventBuffer:
+    """Write-behind queue for care events: a background thread inserts them in group commits.
+
+    A batch is written once it reaches `max_batch` rows or `max_delay` seconds after its first row.
+    Until then the plant's latest pending event is kept in memory so last-care reads can see it.
+    Buffering is per process; other workers see the event once its batch commits.
+    Events whose plant is gone by the time their batch is written are dropped.
+    """
+
+    def __init__(self, app=None, max_batch=500, max_delay=0.05, enabled=False):
+        self.app = app
+        self.enabled = enabled
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.events = 0
+        self.failures = 0
+        self.dropped = 0
+        self._queue = queue.Queue()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config['CARE_EVENT_WRITE_BEHIND']
+        self.max_batch = app.config['CARE_EVENT_FLUSH_SIZE']
+        self.max_delay = app.config['CARE_EVENT_FLUSH_MS'] / 1000
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='care-event-writer', daemon=True)
+                self._thread.start()
+                # Daemon thread so interpreter shutdown isn't blocked; close() drains it first
+                atexit.register(self.close)
+
+    def submit(self, row):
+        self.start()
+        with self._lock:
+            count, latest = self._pending.get(row['plant_id'], (0, None))
+            if latest is None or row['event_date'] >= latest[0]:
+                latest = (row['event_date'], row['event_type'])
+            self._pending[row['plant_id']] = (count + 1, latest)
+        self._queue.put(row)
+
+    def pending_last_care(self, plant_id):
+        with self._lock:
+            entry = self._pending.get(plant_id)
+        return entry[1] if entry else None
+
+    def apply_pending(self, plants):
+        # Overlay buffered events on dashboard rows built from care_summary
+        for plant in plants:
+            latest = self.pending_last_care(plant['id'])
+            if latest and (plant['last_care_date'] is None or latest[0].isoformat() >= plant['last_care_date']):
+                plant['last_care_date'] = latest[0].isoformat()
+                plant['last_care_type'] = latest[1]
+        return plants
+
+    def flush(self):
+        # Blocks until everything submitted before this call is committed (or logged as failed).
+        # Only waits for a marker queued behind those rows, so later submissions can't extend the wait.
+        marker = threading.Event()
+        with self._lock:
+            # Under the lock so the marker can't land behind close()'s stop sentinel
+            if self._thread is None:
+                return
+            self._queue.put(marker)
+        marker.wait()
+
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+        thread.join()
+
+    def stats(self):
+        with self._lock:
+            pending = sum(count for count, _ in self._pending.values())
+        return {'pending': pending, 'batches': self.batches, 'events': self.events,
+                'failures': self.failures, 'dropped': self.dropped}
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            if isinstance(first, threading.Event):
+                first.set()
+                continue
+
+            rows, marker, stop = [first], None, False
+            deadline = time.monotonic() + self.max_delay
+            while len(rows) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    # A flush() is waiting on this batch; write it now instead of at the deadline
+                    marker = item
+                    break
+                rows.append(item)
+
+            self._write(rows)
+            if marker is not None:
+                marker.set()
+            if stop:
+                return
+
+    def _write(self, rows):
+        with self.app.app_context():
+            try:
+                self._commit(rows)
+            except Exception:
+                db.session.rollback()
+                # One bad row (e.g. its plant was deleted meanwhile) shouldn't sink the whole batch
+                logger.exception("Group commit of %d care events failed; retrying one by one", len(rows))
+                for row in rows:
+                    try:
+                        self._commit([row])
+                    except Exception:
+                        db.session.rollback()
+                        self.failures += 1
+                        logger.exception("Dropping care event %r", row)
+            finally:
+                self._release(rows)
+
+    def _commit(self, rows):
+        # The plant may have been deleted since the event was accepted
+        existing = set(db.session.scalars(select(Plants.id).where(Plants.id.in_({row['plant_id'] for row in rows}))))
+        live = [row for row in rows if row['plant_id'] in existing]
+        insert_care_events(live)
+        mark_schedule_dirty(row['plant_id'] for row in live)
+        db.session.commit()
+        self.batches += 1
+        self.events += len(live)
+        self.dropped += len(rows) - len(live)
+
+    def _release(self, rows):
+        with self._lock:
+            for row in rows:
+                count, latest = self._pending[row['plant_id']]
+                if count == 1:
+                    del self._pending[row['plant_id']]
+                else:
+                    self._pending[row['plant_id']] = (count - 1, latest)
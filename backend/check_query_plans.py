@@ -0,0 +1,79 @@
+import argparse
+import sys
+from datetime import date
+from sqlalchemy import select, text
+from app import create_app
+from model import db, User, Species, Plants, Care_Events, plant_owner
+from queries import dashboard_query, schedule_query, care_history_query, plant_owners_query
+from generate_data import build_parser, generate
+
+
+def hot_queries():
+    # The endpoints' own statements, so the check follows any change to them
+    return {
+        'dashboard': dashboard_query(1),
+        'watering_schedule': schedule_query(date.today(), user_id=1),
+        'care_history': care_history_query(1).limit(50),
+        'care_events_by_user': select(Care_Events.id).where(Care_Events.user_id == 1),
+        'plants_by_species': select(Plants.id).where(Plants.species_id == 1),
+        'species_by_scientific_name': select(Species.id).where(Species.scientific_name == 'Spathiphyllum'),
+        'owners_of_plant': select(plant_owner.c.user_id).where(plant_owner.c.plant_id == 1),
+        'owners_page': plant_owners_query(1, after_user_id=100).limit(51),
+        'user_by_username': select(User.id).where(User.username == 'plant_lover'),
+    }
+
+
+def sequential_scans(stmt, force_index=True):
+    conn = db.session.connection()
+    sql = str(stmt.compile(conn, compile_kwargs={'literal_binds': True}))
+
+    if conn.dialect.name == 'sqlite':
+        rows = conn.execute(text('EXPLAIN QUERY PLAN ' + sql)).all()
+        return [row.detail for row in rows
+                if row.detail.startswith('SCAN') and 'INDEX' not in row.detail]
+
+    # Small tables make Postgres prefer seq scans; ask whether an index path exists.
+    # After seeding, the planner's own choice is what gets checked.
+    if force_index:
+        conn.execute(text('SET LOCAL enable_seqscan = off'))
+    plan = conn.execute(text('EXPLAIN (FORMAT JSON) ' + sql)).scalar()
+    scans = []
+    nodes = [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        if node['Node Type'] == 'Seq Scan':
+            scans.append('Seq Scan on ' + node['Relation Name'])
+        nodes.extend(node.get('Plans', []))
+    return scans
+
+
+def seed(users):
+    # Grows the configured database with generate_data.py's defaults and refreshes planner statistics
+    generate(build_parser().parse_args(['--users', str(users)]))
+    db.session.execute(text('ANALYZE'))
+    db.session.commit()
+
+
+def check_query_plans(force_index=True):
+    failures = 0
+    for name, stmt in hot_queries().items():
+        scans = sequential_scans(stmt, force_index)
+        if scans:
+            failures += 1
+            print(f"FAIL {name}: {', '.join(scans)}")
+        else:
+            print(f"ok   {name}")
+    db.session.rollback()
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fail if a hot query plans a sequential scan')
+    parser.add_argument('--seed-users', type=int, default=0,
+                        help='first add this many generated users (with their plants and care events)')
+    args = parser.parse_args()
+
+    with create_app().app_context():
+        if args.seed_users:
+            seed(args.seed_users)
+        sys.exit(1 if check_query_plans(force_index=not args.seed_users) else 0)
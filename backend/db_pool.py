@@ -0,0 +1,112 @@
+import threading
+import time
+from sqlalchemy import event, exc, make_url
+from sqlalchemy.pool import QueuePool, NullPool
+
+
+def env_flag(environ, key, default):
+    return environ.get(key, str(default)).lower() in ('1', 'true', 'yes', 'on')
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def recreate(self):
+        # Keep counters across pool recreation (e.g. after a disconnect invalidation)
+        pool = super().recreate()
+        pool.checkouts, pool.timeouts = self.checkouts, self.timeouts
+        pool.wait_seconds_total, pool.wait_seconds_max = self.wait_seconds_total, self.wait_seconds_max
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+def engine_options(environ, database_uri):
+    url = make_url(database_uri)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        # In-memory SQLite gets SingletonThreadPool/StaticPool, which reject the queue pool arguments
+        return {}
+
+    options = {'pool_pre_ping': env_flag(environ, 'DB_POOL_PRE_PING', True)}
+
+    if env_flag(environ, 'DB_PGBOUNCER', False):
+        # PgBouncer does the pooling; holding our own idle connections just pins server slots
+        options['poolclass'] = NullPool
+    else:
+        options.update({
+            'poolclass': TimedQueuePool,
+            'pool_size': int(environ.get('DB_POOL_SIZE', 5)),
+            'max_overflow': int(environ.get('DB_MAX_OVERFLOW', 10)),
+            'pool_timeout': int(environ.get('DB_POOL_TIMEOUT', 30)),
+            'pool_recycle': int(environ.get('DB_POOL_RECYCLE', 1800)),
+        })
+
+    return options
+
+
+ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite', 'postgresql': 'postgresql+asyncpg'}
+
+
+def async_database_uri(database_uri):
+    scheme, rest = database_uri.split('://', 1)
+    return f"{ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}://{rest}"
+
+
+def async_engine_options(environ, database_uri):
+    # Same settings as the sync engine; async engines need the asyncio-aware pool instead of TimedQueuePool
+    options = engine_options(environ, database_uri)
+    if options.get('poolclass') is TimedQueuePool:
+        del options['poolclass']
+    return options
+
+
+def install_statement_timeout(engine, timeout_ms):
+    if not timeout_ms or engine.dialect.name != 'postgresql':
+        return
+
+    # SET LOCAL per transaction works both directly and behind PgBouncer transaction pooling,
+    # where session-level settings and startup options are not preserved
+    @event.listens_for(engine, 'begin')
+    def set_statement_timeout(conn):
+        conn.exec_driver_sql(f'SET LOCAL statement_timeout = {int(timeout_ms)}')
+
+
+def pool_stats(engine):
+    pool = engine.pool
+    stats = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': max(pool.overflow(), 0),
+        })
+    if isinstance(pool, TimedQueuePool):
+        stats.update({
+            'checkouts_total': pool.checkouts,
+            'checkout_timeouts_total': pool.timeouts,
+            'checkout_wait_seconds_total': round(pool.wait_seconds_total, 6),
+            'checkout_wait_seconds_max': round(pool.wait_seconds_max, 6),
+        })
+    return stats
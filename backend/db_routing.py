@@ -0,0 +1,134 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class ReplicaRouter:
+    """Routes statements from read-only request handlers to replica engines.
+
+    Writes, anything outside a read-only handler, the rest of a request once it has written,
+    and users who wrote in the last `sticky_seconds` all stay on the primary. Recent writes are
+    tracked per process; tokens issued in the last `sticky_seconds` (register, login) also stay
+    on the primary, which holds in every worker. Keep it above the replicas' usual lag.
+    """
+
+    def __init__(self, sticky_seconds=5, maxsize=10000):
+        self.sticky_seconds = sticky_seconds
+        self.maxsize = maxsize
+        self.engines = []
+        self.primary_reads = 0
+        self.replica_reads = []
+        self._next = itertools.count()
+        self._recent_writers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app, make_engine):
+        self.sticky_seconds = app.config['REPLICA_STICKY_SECONDS']
+        self.set_replicas([make_engine(uri) for uri in app.config['SQLALCHEMY_REPLICA_URIS']])
+        app.after_request(self._after_request)
+
+    def set_replicas(self, engines):
+        with self._lock:
+            self.engines = list(engines)
+            self.primary_reads = 0
+            self.replica_reads = [0] * len(self.engines)
+
+    def route(self, is_write):
+        # None means "use the primary"
+        if not self.engines or not has_request_context():
+            return None
+        if is_write:
+            g.db_wrote = True
+            return None
+        if not g.get('read_replica'):
+            return None
+
+        if g.get('db_wrote') or g.get('use_primary') or self._fresh_token() or self._wrote_recently(g.get('user_id')):
+            with self._lock:
+                self.primary_reads += 1
+            return None
+
+        # One replica per request, so a handler's queries see a single snapshot
+        if 'replica_index' not in g:
+            g.replica_index = next(self._next) % len(self.engines)
+        with self._lock:
+            self.replica_reads[g.replica_index] += 1
+        return self.engines[g.replica_index]
+
+    def retry_on_primary(self):
+        # For a read that found nothing on a replica: True when repeating it on the primary may help
+        if not has_request_context() or 'replica_index' not in g or g.get('use_primary'):
+            return False
+        g.use_primary = True
+        return True
+
+    def _fresh_token(self):
+        # `iat` of the request's JWT, set by the auth decorators before their first query
+        issued_at = g.get('token_issued_at')
+        return issued_at is not None and time.time() - issued_at < self.sticky_seconds
+
+    def mark_write(self, user_id):
+        with self._lock:
+            self._recent_writers[user_id] = time.monotonic() + self.sticky_seconds
+            self._recent_writers.move_to_end(user_id)
+            while len(self._recent_writers) > self.maxsize:
+                self._recent_writers.popitem(last=False)
+
+    def _wrote_recently(self, user_id):
+        if user_id is None:
+            return False
+        with self._lock:
+            expires = self._recent_writers.get(user_id)
+            if expires is None:
+                return False
+            if expires > time.monotonic():
+                return True
+            del self._recent_writers[user_id]
+            return False
+
+    def _after_request(self, response):
+        if g.get('db_wrote') and g.get('user_id') is not None:
+            self.mark_write(g.user_id)
+        return response
+
+    def stats(self):
+        with self._lock:
+            replica_reads = sum(self.replica_reads)
+            total = replica_reads + self.primary_reads
+            stats = {
+                'replicas': len(self.engines),
+                'primary_reads': self.primary_reads,
+                'replica_reads': replica_reads,
+                'replica_hit_ratio': round(replica_reads / total, 4) if total else 0.0,
+            }
+            for index, count in enumerate(self.replica_reads):
+                stats[f'replica_{index}_reads'] = count
+            return stats
+
+
+replica_router = ReplicaRouter()
+
+
+def read_only(f):
+    # Marks a handler whose reads may be served by a replica
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        g.read_replica = True
+        return f(*args, **kwargs)
+    return decorated
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that asks the replica router before falling back to the primary."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            engine = replica_router.route(self._flushing or isinstance(clause, UpdateBase))
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
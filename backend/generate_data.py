@@ -0,0 +1,129 @@
+import argparse
+import random
+from datetime import date, timedelta
+from sqlalchemy import insert, select, func
+from app import create_app
+from model import db, User, Species, Plants, Care_Events, plant_owner
+from passwords import hash_password
+from queries import rebuild_care_summary, mark_schedule_dirty
+from watering import parse_watering_frequency
+
+FREQUENCIES = ['Weekly', 'Every 1-2 weeks', 'Every 2-3 weeks', 'Twice a week', 'Every 10 days', 'Monthly', 'Daily']
+EVENT_TYPES = ['watering'] * 8 + ['fertilizing', 'repotting', 'pruning']
+WORDS = ['Golden', 'Silver', 'Variegated', 'Dwarf', 'Giant', 'Trailing', 'Velvet', 'Red', 'Blue', 'Striped',
+         'Monstera', 'Pothos', 'Philodendron', 'Ficus', 'Calathea', 'Alocasia', 'Begonia', 'Hoya', 'Fern', 'Palm']
+
+
+def skewed(rng, mean, alpha=1.5):
+    # Pareto-distributed counts: most users have a few plants, a handful have hundreds
+    scale = mean * (alpha - 1) / alpha
+    return max(1, int(scale * rng.paretovariate(alpha)))
+
+
+def insert_returning_ids(model, rows):
+    return db.session.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows).all()
+
+
+def generate_species(rng, count, chunk_size):
+    start = db.session.scalar(select(func.count(Species.id)))
+    for offset in range(0, count, chunk_size):
+        rows = []
+        for i in range(offset, min(count, offset + chunk_size)):
+            frequency = rng.choice(FREQUENCIES)
+            min_days, max_days = parse_watering_frequency(frequency)
+            rows.append({
+                'common_name': f'{rng.choice(WORDS)} {rng.choice(WORDS)}'[:40],
+                'scientific_name': f'Planta synthetica {start + i}',
+                'watering_frequency': frequency,
+                'watering_interval_min_days': min_days,
+                'watering_interval_max_days': max_days
+            })
+        db.session.execute(insert(Species), rows)
+        db.session.commit()
+    return db.session.scalars(select(Species.id)).all()
+
+
+def generate_users(rng, args, species_ids):
+    password_hash = hash_password(args.password)
+    first_day = date.today() - timedelta(days=args.history_days)
+    # Zipf-like species popularity: a few species account for most plants
+    weights = [1 / (rank + 1) for rank in range(len(species_ids))]
+    start = db.session.scalar(select(func.count(User.id)))
+    totals = {'users': 0, 'plants': 0, 'care_events': 0}
+
+    for offset in range(0, args.users, args.chunk_size):
+        count = min(args.chunk_size, args.users - offset)
+        user_ids = insert_returning_ids(User, [{
+            'username': f'user{start + offset + i}',
+            'email': f'user{start + offset + i}@example.com',
+            'password_hash': password_hash
+        } for i in range(count)])
+
+        owners = [user_id for user_id in user_ids for _ in range(skewed(rng, args.plants_per_user))]
+        plant_species = rng.choices(species_ids, weights=weights, k=len(owners))
+        plant_ids = insert_returning_ids(Plants, [
+            {'nickname': f'Plant {i}', 'species_id': species_id} for i, species_id in enumerate(plant_species)
+        ])
+        db.session.execute(insert(plant_owner), [
+            {'user_id': user_id, 'plant_id': plant_id} for user_id, plant_id in zip(owners, plant_ids)
+        ])
+
+        events = []
+        for user_id, plant_id in zip(owners, plant_ids):
+            for _ in range(skewed(rng, args.events_per_plant)):
+                events.append({
+                    'event_type': rng.choice(EVENT_TYPES),
+                    'event_date': first_day + timedelta(days=rng.randrange(args.history_days)),
+                    'user_id': user_id,
+                    'plant_id': plant_id,
+                    'notes': ''
+                })
+            if len(events) >= args.chunk_size * 10:
+                db.session.execute(insert(Care_Events), events)
+                totals['care_events'] += len(events)
+                events = []
+        if events:
+            db.session.execute(insert(Care_Events), events)
+            totals['care_events'] += len(events)
+        # Every new plant has events (or is due for its first watering), so the scheduler picks them all up
+        mark_schedule_dirty(plant_ids)
+
+        db.session.commit()
+        totals['users'] += count
+        totals['plants'] += len(plant_ids)
+        print(f"{totals['users']}/{args.users} users, {totals['plants']} plants, {totals['care_events']} care events")
+
+    return totals
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Generate synthetic users, species, plants and care events')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--species', type=int, default=500)
+    parser.add_argument('--plants-per-user', type=float, default=8)
+    parser.add_argument('--events-per-plant', type=float, default=40)
+    parser.add_argument('--history-days', type=int, default=3 * 365)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--password', default='password123')
+    parser.add_argument('--seed', type=int, default=42)
+    return parser
+
+
+def generate(args):
+    # Needs an app context; creates any missing tables first
+    rng = random.Random(args.seed)
+    db.create_all()
+    species_ids = generate_species(rng, args.species, args.chunk_size)
+    totals = generate_users(rng, args, species_ids)
+    print(f"Rebuilt care summary for {rebuild_care_summary()} plants")
+    return totals
+
+
+def main():
+    args = build_parser().parse_args()
+    with create_app().app_context():
+        generate(args)
+
+
+if __name__ == '__main__':
+    main()
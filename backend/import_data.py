@@ -0,0 +1,131 @@
+import argparse
+import csv
+import io
+import json
+from datetime import date
+from itertools import islice
+from sqlalchemy import insert
+from sqlalchemy.dialects import sqlite
+from model import db
+from model import User, Species, Care_Events
+from passwords import hash_many
+from queries import rebuild_care_summary, mark_schedule_dirty
+from watering import parse_watering_frequency
+
+
+def read_records(path):
+    # Streams one dict per row so files larger than memory are fine
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.jsonl') or path.endswith('.ndjson'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def chunked(records, size):
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _copy_rows(table, columns, rows):
+    # Postgres: COPY into a temp staging table, then INSERT ... ON CONFLICT DO NOTHING
+    # so duplicate keys are skipped instead of aborting the whole COPY
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(['\\N' if row[column] is None else row[column] for column in columns])
+    buffer.seek(0)
+
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    cursor = db.session.connection().connection.cursor()
+    cursor.execute(f'CREATE TEMP TABLE IF NOT EXISTS staging_{table.name} (LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DELETE ROWS')
+    cursor.copy_expert(f"COPY staging_{table.name} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+    cursor.execute(f'INSERT INTO "{table.name}" ({column_list}) SELECT {column_list} FROM staging_{table.name} ON CONFLICT DO NOTHING')
+    return cursor.rowcount
+
+
+def write_rows(table, rows):
+    if not rows:
+        return 0
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return _copy_rows(table, list(rows[0]), rows)
+    if dialect == 'sqlite':
+        return db.session.execute(sqlite.insert(table).on_conflict_do_nothing(), rows).rowcount
+    return db.session.execute(insert(table), rows).rowcount
+
+
+def species_rows(records):
+    for record in records:
+        min_days, max_days = parse_watering_frequency(record['watering_frequency'])
+        yield {
+            'common_name': record['common_name'],
+            'scientific_name': record['scientific_name'],
+            'watering_frequency': record['watering_frequency'],
+            'watering_interval_min_days': min_days,
+            'watering_interval_max_days': max_days
+        }
+
+
+def care_event_rows(records):
+    for record in records:
+        event_date = record['event_date']
+        yield {
+            'event_type': record['event_type'],
+            'event_date': event_date if isinstance(event_date, date) else date.fromisoformat(event_date),
+            'user_id': int(record['user_id']) if record.get('user_id') else None,
+            'plant_id': int(record['plant_id']),
+            'notes': record.get('notes') or ''
+        }
+
+
+def user_rows(chunk):
+    hashes = hash_many([record['password'] for record in chunk])
+    return [{'username': record['username'], 'email': record['email'], 'password_hash': password_hash}
+            for record, password_hash in zip(chunk, hashes)]
+
+
+def import_records(kind, records, chunk_size=5000, verbose=True):
+    table, to_rows = {
+        'species': (Species.__table__, species_rows),
+        'care-events': (Care_Events.__table__, care_event_rows),
+        'users': (User.__table__, None),
+    }[kind]
+
+    total = 0
+    for chunk in chunked(records, chunk_size):
+        rows = user_rows(chunk) if kind == 'users' else list(to_rows(chunk))
+        total += max(write_rows(table, rows), 0)
+        if kind == 'care-events':
+            # Same transaction as the rows, so the reminder scheduler recomputes these plants
+            mark_schedule_dirty(row['plant_id'] for row in rows)
+        db.session.commit()
+        if verbose:
+            print(f"Imported {total} {kind}")
+
+    if kind == 'care-events':
+        rebuild_care_summary()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk import CSV or JSONL files')
+    parser.add_argument('kind', choices=['species', 'users', 'care-events'])
+    parser.add_argument('path')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    from app import create_app
+    with create_app().app_context():
+        db.create_all()
+        import_records(args.kind, read_records(args.path), args.chunk_size)
+
+
+if __name__ == '__main__':
+    main()
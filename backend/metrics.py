@@ -0,0 +1,126 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from flask import g, request, has_request_context
+from sqlalchemy import event
+
+logger = logging.getLogger('plant_parenthood.metrics')
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels.items()) + '}'
+
+
+class RequestMetrics:
+    """Per-endpoint latency histograms plus SQL counts/time, rendered in Prometheus text format."""
+
+    def __init__(self, slow_query_seconds=0.25, buckets=LATENCY_BUCKETS):
+        self.slow_query_seconds = slow_query_seconds
+        self.buckets = buckets
+        self.latency = {}
+        self.responses = {}
+        self.sql_statements = {}
+        self.sql_seconds = {}
+        self.slow_queries = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app, engine):
+        self.slow_query_seconds = app.config['SLOW_QUERY_MS'] / 1000
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        self.instrument_engine(engine)
+
+    def instrument_engine(self, engine):
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _before_request(self):
+        g.metrics_started = time.perf_counter()
+        g.sql_statements = 0
+        g.sql_seconds = 0.0
+
+    def _after_request(self, response):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return response
+
+        elapsed = time.perf_counter() - started
+        endpoint = request.endpoint or 'unmatched'
+        with self._lock:
+            if endpoint not in self.latency:
+                self.latency[endpoint] = Histogram(self.buckets)
+            self.latency[endpoint].observe(elapsed)
+            key = (endpoint, request.method, response.status_code)
+            self.responses[key] = self.responses.get(key, 0) + 1
+            self.sql_statements[endpoint] = self.sql_statements.get(endpoint, 0) + g.sql_statements
+            self.sql_seconds[endpoint] = self.sql_seconds.get(endpoint, 0.0) + g.sql_seconds
+        return response
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info['query_started'] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop('query_started', None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        route = None
+        if has_request_context() and 'sql_statements' in g:
+            g.sql_statements += 1
+            g.sql_seconds += elapsed
+            route = request.endpoint
+
+        if elapsed >= self.slow_query_seconds:
+            with self._lock:
+                self.slow_queries += 1
+            logger.warning("Slow query (%.1f ms) on route %s: %s", elapsed * 1000, route, statement[:500])
+
+    def render(self, gauges=None):
+        lines = []
+        with self._lock:
+            lines.append('# TYPE http_request_duration_seconds histogram')
+            for endpoint, histogram in sorted(self.latency.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{_labels(endpoint=endpoint, le=bound)} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{_labels(endpoint=endpoint, le="+Inf")} {histogram.count}')
+                lines.append(f'http_request_duration_seconds_sum{_labels(endpoint=endpoint)} {histogram.total:.6f}')
+                lines.append(f'http_request_duration_seconds_count{_labels(endpoint=endpoint)} {histogram.count}')
+
+            lines.append('# TYPE http_responses_total counter')
+            for (endpoint, method, status), count in sorted(self.responses.items()):
+                lines.append(f'http_responses_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+            lines.append('# TYPE db_statements_total counter')
+            for endpoint, count in sorted(self.sql_statements.items()):
+                lines.append(f'db_statements_total{_labels(endpoint=endpoint)} {count}')
+
+            lines.append('# TYPE db_seconds_total counter')
+            for endpoint, seconds in sorted(self.sql_seconds.items()):
+                lines.append(f'db_seconds_total{_labels(endpoint=endpoint)} {seconds:.6f}')
+
+            lines.append('# TYPE db_slow_queries_total counter')
+            lines.append(f'db_slow_queries_total {self.slow_queries}')
+
+        for name, value in (gauges or {}).items():
+            lines.append(f'{name} {value}')
+
+        return '\n'.join(lines) + '\n'
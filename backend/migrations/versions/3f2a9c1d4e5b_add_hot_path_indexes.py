@@ -0,0 +1,50 @@
+"""add hot path indexes
+
+Revision ID: 3f2a9c1d4e5b
+Revises: d5f33ca22bcd
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d4e5b'
+down_revision = 'd5f33ca22bcd'
+branch_labels = None
+depends_on = None
+
+
+# Databases built by db.create_all may already have some of these indexes.
+def upgrade():
+    # create_species checked for the name before inserting, so concurrent requests could store
+    # duplicates. Keep the lowest id per scientific_name and repoint plants at it, so the unique
+    # index below can be built.
+    op.execute("""
+        UPDATE plants SET species_id = (
+            SELECT min(keep.id) FROM species keep JOIN species dup ON dup.scientific_name = keep.scientific_name
+            WHERE dup.id = plants.species_id
+        )
+        WHERE species_id IN (
+            SELECT dup.id FROM species dup
+            WHERE EXISTS (SELECT 1 FROM species keep WHERE keep.scientific_name = dup.scientific_name AND keep.id < dup.id)
+        )
+    """)
+    op.execute("""
+        DELETE FROM species
+        WHERE EXISTS (SELECT 1 FROM species keep WHERE keep.scientific_name = species.scientific_name AND keep.id < species.id)
+    """)
+    op.create_index('ix_care_events_plant_id_event_date', 'care_events', ['plant_id', 'event_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_care_events_user_id', 'care_events', ['user_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_plants_species_id', 'plants', ['species_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_species_scientific_name', 'species', ['scientific_name'], unique=True, if_not_exists=True)
+    op.create_index('ix_plant_owner_plant_id', 'plant_owner', ['plant_id'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_plant_owner_plant_id', table_name='plant_owner')
+    op.drop_index('ix_species_scientific_name', table_name='species')
+    op.drop_index('ix_plants_species_id', table_name='plants')
+    op.drop_index('ix_care_events_user_id', table_name='care_events')
+    op.drop_index('ix_care_events_plant_id_event_date', table_name='care_events')
@@ -0,0 +1,28 @@
+"""add plant_owner shared_at
+
+Revision ID: 5e9b1c7a3f24
+Revises: d81a6f3c2b97
+Create Date: 2026-10-18 13:27:09.665142
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e9b1c7a3f24'
+down_revision = 'd81a6f3c2b97'
+branch_labels = None
+depends_on = None
+
+
+# Existing owner rows stay NULL, so everyone who owns a plant today counts as one of its creators
+def upgrade():
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('plant_owner')]
+    if 'shared_at' not in columns:
+        op.add_column('plant_owner', sa.Column('shared_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('plant_owner') as batch_op:
+        batch_op.drop_column('shared_at')
@@ -0,0 +1,54 @@
+"""add species search index
+
+Revision ID: 8b41d07e2c6a
+Revises: 3f2a9c1d4e5b
+Create Date: 2026-10-17 11:40:02.551873
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b41d07e2c6a'
+down_revision = '3f2a9c1d4e5b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS species_fts USING fts5(
+            common_name, scientific_name, content='species', content_rowid='id', tokenize='trigram')""")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS species_fts_insert AFTER INSERT ON species BEGIN
+            INSERT INTO species_fts(rowid, common_name, scientific_name)
+            VALUES (new.id, new.common_name, new.scientific_name);
+        END""")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS species_fts_delete AFTER DELETE ON species BEGIN
+            INSERT INTO species_fts(species_fts, rowid, common_name, scientific_name)
+            VALUES ('delete', old.id, old.common_name, old.scientific_name);
+        END""")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS species_fts_update AFTER UPDATE ON species BEGIN
+            INSERT INTO species_fts(species_fts, rowid, common_name, scientific_name)
+            VALUES ('delete', old.id, old.common_name, old.scientific_name);
+            INSERT INTO species_fts(rowid, common_name, scientific_name)
+            VALUES (new.id, new.common_name, new.scientific_name);
+        END""")
+        op.execute("INSERT INTO species_fts(species_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_species_common_name_trgm ON species USING gin (common_name gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_species_scientific_name_trgm ON species USING gin (scientific_name gin_trgm_ops)")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS species_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS species_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS species_fts_insert")
+        op.execute("DROP TABLE IF EXISTS species_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_species_scientific_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_species_common_name_trgm")
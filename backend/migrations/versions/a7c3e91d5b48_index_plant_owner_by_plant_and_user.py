@@ -0,0 +1,28 @@
+"""index plant_owner by plant and user
+
+Revision ID: a7c3e91d5b48
+Revises: f4d6b8e02a17
+Create Date: 2026-10-17 18:12:40.531872
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e91d5b48'
+down_revision = 'f4d6b8e02a17'
+branch_labels = None
+depends_on = None
+
+
+# Shared plants list their owners in user_id order and check for "another owner" by plant;
+# (plant_id, user_id) answers both from the index. The old index is a prefix of this one.
+def upgrade():
+    op.create_index('ix_plant_owner_plant_id_user_id', 'plant_owner', ['plant_id', 'user_id'], unique=False, if_not_exists=True)
+    op.drop_index('ix_plant_owner_plant_id', table_name='plant_owner', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_plant_owner_plant_id', 'plant_owner', ['plant_id'], unique=False)
+    op.drop_index('ix_plant_owner_plant_id_user_id', table_name='plant_owner')
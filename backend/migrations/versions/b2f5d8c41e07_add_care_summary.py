@@ -0,0 +1,43 @@
+"""add care summary
+
+Revision ID: b2f5d8c41e07
+Revises: a7c3e91d5b48
+Create Date: 2026-10-18 10:14:26.093518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2f5d8c41e07'
+down_revision = 'a7c3e91d5b48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'care_summary' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table('care_summary',
+            sa.Column('plant_id', sa.Integer(), nullable=False),
+            sa.Column('last_care_date', sa.Date(), nullable=False),
+            sa.Column('last_care_type', sa.String(length=50), nullable=False),
+            sa.ForeignKeyConstraint(['plant_id'], ['plants.id']),
+            sa.PrimaryKeyConstraint('plant_id')
+        )
+
+    # Backfill each plant's latest care event; rows a create_all database already has are left alone
+    op.execute("""
+        INSERT INTO care_summary (plant_id, last_care_date, last_care_type)
+        SELECT plant_id, event_date, event_type FROM (
+            SELECT care_events.plant_id, care_events.event_date, care_events.event_type,
+                   row_number() OVER (PARTITION BY care_events.plant_id
+                                      ORDER BY care_events.event_date DESC, care_events.id DESC) AS rn
+            FROM care_events JOIN plants ON plants.id = care_events.plant_id
+        ) AS latest
+        WHERE rn = 1 AND NOT EXISTS (SELECT 1 FROM care_summary WHERE care_summary.plant_id = latest.plant_id)
+    """)
+
+
+def downgrade():
+    op.drop_table('care_summary')
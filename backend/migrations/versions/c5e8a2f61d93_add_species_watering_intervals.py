@@ -0,0 +1,48 @@
+"""add species watering intervals
+
+Revision ID: c5e8a2f61d93
+Revises: 8b41d07e2c6a
+Create Date: 2026-10-17 14:05:37.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e8a2f61d93'
+down_revision = '8b41d07e2c6a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    from watering import parse_watering_frequency
+
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('species')]
+    if 'watering_interval_min_days' not in columns:
+        op.add_column('species', sa.Column('watering_interval_min_days', sa.Integer(), nullable=True))
+        op.add_column('species', sa.Column('watering_interval_max_days', sa.Integer(), nullable=True))
+
+    species = sa.table('species',
+        sa.column('id', sa.Integer),
+        sa.column('watering_frequency', sa.String),
+        sa.column('watering_interval_min_days', sa.Integer),
+        sa.column('watering_interval_max_days', sa.Integer)
+    )
+    bind = op.get_bind()
+    frequencies = bind.execute(sa.select(species.c.watering_frequency).distinct()).scalars().all()
+    for frequency in frequencies:
+        min_days, max_days = parse_watering_frequency(frequency)
+        if min_days is None:
+            continue
+        bind.execute(
+            species.update()
+                .where(species.c.watering_frequency == frequency)
+                .values(watering_interval_min_days=min_days, watering_interval_max_days=max_days)
+        )
+
+
+def downgrade():
+    op.drop_column('species', 'watering_interval_max_days')
+    op.drop_column('species', 'watering_interval_min_days')
@@ -0,0 +1,76 @@
+"""create base tables
+
+Revision ID: d5f33ca22bcd
+Revises: 
+Create Date: 2026-10-17 09:05:12.774031
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5f33ca22bcd'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# The schema as db.create_all built it before migrations existed. Databases made that way
+# already have these tables, so each one is only created when missing.
+def upgrade():
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if 'user' not in tables:
+        op.create_table('user',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('username', sa.String(length=30), nullable=False),
+            sa.Column('email', sa.String(length=120), nullable=False),
+            sa.Column('password_hash', sa.String(length=128), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('email'),
+            sa.UniqueConstraint('username')
+        )
+    if 'species' not in tables:
+        op.create_table('species',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('common_name', sa.String(length=40), nullable=False),
+            sa.Column('scientific_name', sa.String(length=40), nullable=False),
+            sa.Column('watering_frequency', sa.String(length=40), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'plants' not in tables:
+        op.create_table('plants',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('nickname', sa.String(length=40), nullable=False),
+            sa.Column('species_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['species_id'], ['species.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'care_events' not in tables:
+        op.create_table('care_events',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('event_type', sa.String(length=50), nullable=False),
+            sa.Column('notes', sa.Text(), nullable=True),
+            sa.Column('event_date', sa.Date(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=True),
+            sa.Column('plant_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['plant_id'], ['plants.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'plant_owner' not in tables:
+        op.create_table('plant_owner',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('plant_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['plant_id'], ['plants.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id']),
+            sa.PrimaryKeyConstraint('user_id', 'plant_id')
+        )
+
+
+def downgrade():
+    op.drop_table('plant_owner')
+    op.drop_table('care_events')
+    op.drop_table('plants')
+    op.drop_table('species')
+    op.drop_table('user')
@@ -0,0 +1,45 @@
+"""reparse species watering intervals
+
+Revision ID: d81a6f3c2b97
+Revises: b2f5d8c41e07
+Create Date: 2026-10-18 11:02:53.418760
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81a6f3c2b97'
+down_revision = 'b2f5d8c41e07'
+branch_labels = None
+depends_on = None
+
+
+# The parser now combines every phrase and no longer reads "every few days" as daily,
+# so intervals stored by the earlier revision are recomputed
+def upgrade():
+    from watering import parse_watering_frequency
+
+    species = sa.table('species',
+        sa.column('watering_frequency', sa.String),
+        sa.column('watering_interval_min_days', sa.Integer),
+        sa.column('watering_interval_max_days', sa.Integer)
+    )
+    bind = op.get_bind()
+    frequencies = bind.execute(sa.select(species.c.watering_frequency).distinct()).scalars().all()
+    for frequency in frequencies:
+        min_days, max_days = parse_watering_frequency(frequency)
+        bind.execute(
+            species.update()
+                .where(species.c.watering_frequency == frequency)
+                .where(sa.or_(
+                    species.c.watering_interval_min_days.is_distinct_from(min_days),
+                    species.c.watering_interval_max_days.is_distinct_from(max_days)
+                ))
+                .values(watering_interval_min_days=min_days, watering_interval_max_days=max_days)
+        )
+
+
+def downgrade():
+    pass
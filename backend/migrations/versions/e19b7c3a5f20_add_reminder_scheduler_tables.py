@@ -0,0 +1,43 @@
+"""add reminder scheduler tables
+
+Revision ID: e19b7c3a5f20
+Revises: c5e8a2f61d93
+Create Date: 2026-10-17 15:22:18.640517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e19b7c3a5f20'
+down_revision = 'c5e8a2f61d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if 'schedule_changes' not in tables:
+        op.create_table('schedule_changes',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('plant_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'reminder_outbox' not in tables:
+        op.create_table('reminder_outbox',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('plant_id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('due_date', sa.Date(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('sent_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('plant_id', 'user_id', 'due_date', name='uq_reminder_outbox_plant_user_due')
+        )
+
+
+def downgrade():
+    op.drop_table('reminder_outbox')
+    op.drop_table('schedule_changes')
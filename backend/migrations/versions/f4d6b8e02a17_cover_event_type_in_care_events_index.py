@@ -0,0 +1,28 @@
+"""cover event_type in care_events index
+
+Revision ID: f4d6b8e02a17
+Revises: e19b7c3a5f20
+Create Date: 2026-10-17 16:48:51.207339
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4d6b8e02a17'
+down_revision = 'e19b7c3a5f20'
+branch_labels = None
+depends_on = None
+
+
+# Stats and schedule queries filter each plant's history by event_type; carrying it
+# in the index keeps those scans off the table. The old index is a prefix of this one.
+def upgrade():
+    op.create_index('ix_care_events_plant_id_event_date_type', 'care_events', ['plant_id', 'event_date', 'event_type'], unique=False, if_not_exists=True)
+    op.drop_index('ix_care_events_plant_id_event_date', table_name='care_events', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_care_events_plant_id_event_date', 'care_events', ['plant_id', 'event_date'], unique=False)
+    op.drop_index('ix_care_events_plant_id_event_date_type', table_name='care_events')
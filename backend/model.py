@@ -1,15 +1,22 @@
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy_serializer import SerializerMixin
-import bcrypt
+from sqlalchemy.orm import validates
+from datetime import datetime
+from serializers import species_dict
+from passwords import hash_password, check_password, needs_rehash
+from watering import parse_watering_frequency
+from db_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 plant_owner = db.Table('plant_owner',
     db.Column('user_id', db.Integer, db.ForeignKey('user.id'), primary_key=True),
-    db.Column('plant_id', db.Integer, db.ForeignKey('plants.id'), primary_key=True)
+    db.Column('plant_id', db.Integer, db.ForeignKey('plants.id'), primary_key=True),
+    # NULL for whoever created the plant; set when it is shared with someone
+    db.Column('shared_at', db.DateTime),
+    db.Index('ix_plant_owner_plant_id_user_id', 'plant_id', 'user_id')
 )
 
-class User(db.Model, SerializerMixin):
+class User(db.Model):
     __tablename__ = 'user'
 
     id = db.Column(db.Integer, primary_key=True)
@@ -20,14 +27,14 @@ class User(db.Model, SerializerMixin):
     plants = db.relationship('Plants', secondary=plant_owner, back_populates='users')
     care_events = db.relationship('Care_Events', back_populates='user')
 
-    serialize_rules = ('-plants.users', '-care_events.user', '-plants.care_events')
-
     def set_password(self, password):
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = hash_password(password)
 
     def check_password(self, password):
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return check_password(password, self.password_hash)
+
+    def password_needs_rehash(self):
+        return needs_rehash(self.password_hash)
 
     def to_dict(self):
         return {
@@ -37,71 +44,61 @@ class User(db.Model, SerializerMixin):
             'plants': [ {'id': plant.id, 'nickname': plant.nickname} for plant in self.plants ]
         }
 
-class Species(db.Model, SerializerMixin):
+class Species(db.Model):
     __tablename__ = 'species'
     
     id = db.Column(db.Integer, primary_key=True)
     common_name = db.Column(db.String(40), nullable=False)
-    scientific_name = db.Column(db.String(40), nullable=False)
+    scientific_name = db.Column(db.String(40), nullable=False, unique=True, index=True)
     watering_frequency = db.Column(db.String(40), nullable=False)
+    watering_interval_min_days = db.Column(db.Integer)
+    watering_interval_max_days = db.Column(db.Integer)
     
     plants = db.relationship('Plants', back_populates='species')
     
-    serialize_rules = ('-plants.species',)
+    @validates('watering_frequency')
+    def validate_watering_frequency(self, key, value):
+        self.watering_interval_min_days, self.watering_interval_max_days = parse_watering_frequency(value)
+        return value
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'common_name': self.common_name,
-            'scientific_name': self.scientific_name,
-            'watering_frequency': self.watering_frequency
-        }
+        return species_dict(self.id, self.common_name, self.scientific_name, self.watering_frequency)
 
-class Plants(db.Model, SerializerMixin):
+class Plants(db.Model):
     __tablename__ = 'plants'  
     
     id = db.Column(db.Integer, primary_key=True)
     nickname = db.Column(db.String(40), nullable=False)
-    species_id = db.Column(db.Integer, db.ForeignKey('species.id')) 
+    species_id = db.Column(db.Integer, db.ForeignKey('species.id'), index=True)
     
     users = db.relationship('User', secondary=plant_owner, back_populates='plants')
     species = db.relationship('Species', back_populates='plants')
     care_events = db.relationship('Care_Events', back_populates='plant') 
     
-    serialize_rules = ('-users.plants', '-species.plants', '-care_events.plant')
-
     def to_dict(self):
-        species_info = None
-        if self.species:
-            species_info = {
-                'id': self.species.id,
-                'common_name': self.species.common_name,
-                'scientific_name': self.species.scientific_name,
-                'watering_frequency': self.species.watering_frequency
-            }
-        
         return {
             'id': self.id,
             'nickname': self.nickname,
             'species_id': self.species_id,
-            'species': species_info 
+            'species': self.species.to_dict() if self.species else None
         }
 
-class Care_Events(db.Model, SerializerMixin):
+class Care_Events(db.Model):
     __tablename__ = 'care_events'
+    __table_args__ = (
+        db.Index('ix_care_events_plant_id_event_date_type', 'plant_id', 'event_date', 'event_type'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     event_type = db.Column(db.String(50), nullable=False)
     notes = db.Column(db.Text)
     event_date = db.Column(db.Date, nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), index=True)
     plant_id = db.Column(db.Integer, db.ForeignKey('plants.id'))
     
     user = db.relationship('User', back_populates='care_events')
     plant = db.relationship('Plants', back_populates='care_events')  
     
-    serialize_rules = ('-user.care_events', '-plant.care_events')
-
     def to_dict(self):
         return {
             'id': self.id,
@@ -110,4 +107,31 @@ class Care_Events(db.Model, SerializerMixin):
             'event_date': self.event_date.isoformat() if self.event_date else None,
             'user_id': self.user_id,
             'plant_id': self.plant_id
-        }
\ No newline at end of file
+        }
+
+class Care_Summary(db.Model):
+    __tablename__ = 'care_summary'
+
+    plant_id = db.Column(db.Integer, db.ForeignKey('plants.id'), primary_key=True)
+    last_care_date = db.Column(db.Date, nullable=False)
+    last_care_type = db.Column(db.String(50), nullable=False)
+
+class Schedule_Changes(db.Model):
+    __tablename__ = 'schedule_changes'
+
+    id = db.Column(db.Integer, primary_key=True)
+    plant_id = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+class Reminder_Outbox(db.Model):
+    __tablename__ = 'reminder_outbox'
+    __table_args__ = (
+        db.UniqueConstraint('plant_id', 'user_id', 'due_date', name='uq_reminder_outbox_plant_user_due'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    plant_id = db.Column(db.Integer, nullable=False)
+    user_id = db.Column(db.Integer, nullable=False)
+    due_date = db.Column(db.Date, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import bcrypt
+from flask import current_app, has_app_context
+
+DEFAULT_ROUNDS = 12
+# Per server process, so the total is this times the number of gunicorn/uvicorn workers
+DEFAULT_POOL_SIZE = min(2, os.cpu_count() or 1)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _config(key, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+def configured_rounds():
+    return int(_config('BCRYPT_LOG_ROUNDS', os.environ.get('BCRYPT_LOG_ROUNDS', DEFAULT_ROUNDS)))
+
+
+def _pool_context():
+    # The server already runs threads (care-event writer, connection pools); forking it can
+    # copy a held lock into the child, so workers come from a clean forkserver process instead
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _get_pool():
+    global _pool
+    size = int(_config('BCRYPT_POOL_SIZE', os.environ.get('BCRYPT_POOL_SIZE', DEFAULT_POOL_SIZE)))
+    if size <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=size, mp_context=_pool_context())
+        return _pool
+
+
+def _hashpw(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _checkpw(password, password_hash):
+    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+
+def _run(fn, *args):
+    # bcrypt is CPU bound; keep it off the request worker when a pool is configured
+    global _pool
+    pool = _get_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        with _pool_lock:
+            _pool = None
+        return fn(*args)
+
+
+def hash_password(password, rounds=None):
+    return _run(_hashpw, password, rounds or configured_rounds())
+
+
+def check_password(password, password_hash):
+    return _run(_checkpw, password, password_hash)
+
+
+def hash_many(passwords, rounds=None):
+    # Bulk seeding/imports: spread the hashes across every pool worker
+    rounds = rounds or configured_rounds()
+    pool = _get_pool()
+    if pool is None:
+        return [_hashpw(password, rounds) for password in passwords]
+    return list(pool.map(_hashpw, passwords, [rounds] * len(passwords)))
+
+
+def hash_rounds(password_hash):
+    # bcrypt hashes look like $2b$12$<salt+digest>
+    try:
+        return int(password_hash.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(password_hash, rounds=None):
+    return hash_rounds(password_hash) != (rounds or configured_rounds())
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
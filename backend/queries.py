@@ -0,0 +1,329 @@
+from datetime import datetime
+from sqlalchemy import select, insert, delete, func, exists, and_, or_, case, literal, Date, Integer
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from model import db, User, Plants, Species, Care_Events, Care_Summary, Schedule_Changes, plant_owner
+from serializers import plant_row_dict, dashboard_row_dict, species_row_dict, schedule_row_dict
+
+
+class date_add_days(FunctionElement):
+    """date + integer days, portable across SQLite and Postgres."""
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(date_add_days)
+def _date_add_days_default(element, compiler, **kw):
+    start, days = list(element.clauses)
+    return f"({compiler.process(start, **kw)} + {compiler.process(days, **kw)})"
+
+
+@compiles(date_add_days, 'sqlite')
+def _date_add_days_sqlite(element, compiler, **kw):
+    start, days = list(element.clauses)
+    return f"date({compiler.process(start, **kw)}, '+' || {compiler.process(days, **kw)} || ' days')"
+
+
+class days_between(FunctionElement):
+    """Whole days from the second date to the first, portable across SQLite and Postgres."""
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"({compiler.process(end, **kw)} - {compiler.process(start, **kw)})"
+
+
+@compiles(days_between, 'sqlite')
+def _days_between_sqlite(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"CAST(julianday({compiler.process(end, **kw)}) - julianday({compiler.process(start, **kw)}) AS INTEGER)"
+
+
+def latest_care_subquery(plant_ids=None):
+    ranked = select(
+        Care_Events.plant_id,
+        Care_Events.event_date,
+        Care_Events.event_type,
+        func.row_number().over(
+            partition_by=Care_Events.plant_id,
+            order_by=(Care_Events.event_date.desc(), Care_Events.id.desc())
+        ).label('rn')
+    )
+    if plant_ids is not None:
+        ranked = ranked.where(Care_Events.plant_id.in_(plant_ids))
+    ranked = ranked.subquery()
+
+    return select(ranked.c.plant_id, ranked.c.event_date, ranked.c.event_type)\
+        .where(ranked.c.rn == 1).subquery('latest_care')
+
+
+def update_care_summary(plant_id, event_date, event_type):
+    # Called inside the care event's transaction; older backdated events don't win
+    update_care_summaries({plant_id: (event_date, event_type)})
+
+
+def update_care_summaries(latest_by_plant):
+    # One upsert for the batch, so concurrent first events for a plant can't collide on the
+    # primary key and a concurrent later event can't be overwritten by an older one
+    if not latest_by_plant:
+        return
+    rows = [
+        {'plant_id': plant_id, 'last_care_date': event_date, 'last_care_type': event_type}
+        for plant_id, (event_date, event_type) in latest_by_plant.items()
+    ]
+    table = Care_Summary.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        stmt = (postgresql if dialect == 'postgresql' else sqlite).insert(table)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.plant_id],
+            set_={'last_care_date': stmt.excluded.last_care_date, 'last_care_type': stmt.excluded.last_care_type},
+            where=stmt.excluded.last_care_date >= table.c.last_care_date
+        ), rows)
+        return
+
+    # Other backends: read-then-write, racy under concurrent first events
+    existing = {
+        summary.plant_id: summary for summary in
+        db.session.scalars(select(Care_Summary).where(Care_Summary.plant_id.in_(list(latest_by_plant))))
+    }
+    for row in rows:
+        summary = existing.get(row['plant_id'])
+        if summary is None:
+            db.session.add(Care_Summary(**row))
+        elif row['last_care_date'] >= summary.last_care_date:
+            summary.last_care_date = row['last_care_date']
+            summary.last_care_type = row['last_care_type']
+
+
+def owned_plant_ids(user_id, plant_ids):
+    return set(db.session.scalars(
+        select(plant_owner.c.plant_id)
+            .where(plant_owner.c.user_id == user_id, plant_owner.c.plant_id.in_(list(plant_ids)))
+    ))
+
+
+def mark_schedule_dirty(plant_ids):
+    # Written in the caller's transaction; the reminder scheduler tails this table
+    rows = [{'plant_id': plant_id} for plant_id in set(plant_ids)]
+    if rows:
+        db.session.execute(insert(Schedule_Changes), rows)
+
+
+def user_owns_plant(user_id, plant_id):
+    return db.session.scalar(select(exists().where(
+        plant_owner.c.user_id == user_id, plant_owner.c.plant_id == plant_id
+    )))
+
+
+def has_other_owner(plant_id, user_id):
+    return db.session.scalar(select(exists().where(
+        plant_owner.c.plant_id == plant_id, plant_owner.c.user_id != user_id
+    )))
+
+
+def add_plant_owner(plant_id, user_id):
+    # Sharing twice is a no-op rather than a primary key violation; returns whether a row was added
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(plant_owner).on_conflict_do_nothing()
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(plant_owner).on_conflict_do_nothing()
+    elif user_owns_plant(user_id, plant_id):
+        return False
+    else:
+        stmt = insert(plant_owner)
+    return db.session.execute(stmt, {'plant_id': plant_id, 'user_id': user_id, 'shared_at': datetime.utcnow()}).rowcount > 0
+
+
+def joined_before(plant_id, user_id, owner_id):
+    # Creators (shared_at NULL) come before every sharee; sharees rank by when they were added
+    mine = plant_owner.alias('mine')
+    theirs = plant_owner.alias('theirs')
+    return db.session.scalar(select(exists().where(
+        mine.c.plant_id == plant_id, mine.c.user_id == user_id,
+        theirs.c.plant_id == plant_id, theirs.c.user_id == owner_id,
+        theirs.c.shared_at.is_not(None),
+        or_(mine.c.shared_at.is_(None), mine.c.shared_at < theirs.c.shared_at)
+    )))
+
+
+def remove_plant_owner(plant_id, user_id):
+    return db.session.execute(delete(plant_owner).where(
+        plant_owner.c.plant_id == plant_id, plant_owner.c.user_id == user_id
+    )).rowcount > 0
+
+
+def create_plants(user_id, rows):
+    # One INSERT ... RETURNING for the plants, one executemany for their owner rows
+    if not rows:
+        return []
+    plant_ids = db.session.scalars(
+        insert(Plants).returning(Plants.id, sort_by_parameter_order=True), rows
+    ).all()
+    db.session.execute(insert(plant_owner), [{'user_id': user_id, 'plant_id': plant_id} for plant_id in plant_ids])
+    mark_schedule_dirty(plant_ids)
+    return plant_ids
+
+
+def delete_plants(plant_ids):
+    # Set-based, children first, so deleting a widely shared plant or a whole greenhouse
+    # never loads owners or care history into the session
+    plant_ids = list(plant_ids)
+    if not plant_ids:
+        return
+    db.session.execute(delete(Care_Summary.__table__).where(Care_Summary.plant_id.in_(plant_ids)))
+    db.session.execute(delete(Care_Events.__table__).where(Care_Events.plant_id.in_(plant_ids)))
+    db.session.execute(delete(plant_owner).where(plant_owner.c.plant_id.in_(plant_ids)))
+    db.session.execute(delete(Plants.__table__).where(Plants.id.in_(plant_ids)))
+    mark_schedule_dirty(plant_ids)
+
+
+def plant_owners_query(plant_id, after_user_id=None):
+    # Keyset on user_id, walked in order straight off ix_plant_owner_plant_id_user_id
+    stmt = select(User.id, User.username)\
+        .join(plant_owner, plant_owner.c.user_id == User.id)\
+        .where(plant_owner.c.plant_id == plant_id)\
+        .order_by(plant_owner.c.user_id)
+    if after_user_id is not None:
+        stmt = stmt.where(plant_owner.c.user_id > after_user_id)
+    return stmt
+
+
+def care_history_query(plant_id, before=None):
+    # Newest first; `before` is the (event_date, id) keyset of the last row already sent
+    stmt = select(Care_Events).where(Care_Events.plant_id == plant_id)
+    if before is not None:
+        before_date, before_id = before
+        stmt = stmt.where(or_(
+            Care_Events.event_date < before_date,
+            and_(Care_Events.event_date == before_date, Care_Events.id < before_id)
+        ))
+    return stmt.order_by(Care_Events.event_date.desc(), Care_Events.id.desc())
+
+
+def insert_care_events(rows):
+    # executemany with RETURNING; ids come back in the same order as rows
+    if not rows:
+        return []
+    latest_by_plant = {}
+    for row in rows:
+        latest = latest_by_plant.get(row['plant_id'])
+        if latest is None or row['event_date'] >= latest[0]:
+            latest_by_plant[row['plant_id']] = (row['event_date'], row['event_type'])
+
+    ids = db.session.scalars(
+        insert(Care_Events).returning(Care_Events.id, sort_by_parameter_order=True), rows
+    ).all()
+    update_care_summaries(latest_by_plant)
+    return ids
+
+
+def rebuild_care_summary():
+    latest = latest_care_subquery()
+    db.session.execute(delete(Care_Summary))
+    db.session.execute(
+        insert(Care_Summary).from_select(
+            ['plant_id', 'last_care_date', 'last_care_type'],
+            select(latest.c.plant_id, latest.c.event_date, latest.c.event_type)
+                .join(Plants, Plants.id == latest.c.plant_id)
+        )
+    )
+    db.session.commit()
+    return db.session.scalar(select(func.count()).select_from(Care_Summary))
+
+
+PLANT_COLUMNS = (
+    Plants.id,
+    Plants.nickname,
+    Plants.species_id,
+    Species.id.label('s_id'),
+    Species.common_name,
+    Species.scientific_name,
+    Species.watering_frequency
+)
+
+
+def user_plants_query(user_id, *extra_columns):
+    return select(*PLANT_COLUMNS, *extra_columns)\
+        .join(plant_owner, plant_owner.c.plant_id == Plants.id)\
+        .outerjoin(Species, Species.id == Plants.species_id)\
+        .where(plant_owner.c.user_id == user_id)\
+        .order_by(Plants.id)
+
+
+def user_plants(user_id):
+    return [plant_row_dict(row) for row in db.session.execute(user_plants_query(user_id))]
+
+
+def dashboard_query(user_id):
+    # One round trip: owned plants + species + last care from the summary table
+    return user_plants_query(user_id, Care_Summary.last_care_date, Care_Summary.last_care_type)\
+        .outerjoin(Care_Summary, Care_Summary.plant_id == Plants.id)
+
+
+def dashboard_plants(user_id):
+    return [dashboard_row_dict(row) for row in db.session.execute(dashboard_query(user_id))]
+
+
+def species_query():
+    return select(Species.id, Species.common_name, Species.scientific_name, Species.watering_frequency)\
+        .order_by(Species.id)
+
+
+def all_species():
+    return [species_row_dict(row) for row in db.session.execute(species_query())]
+
+
+def last_watered_subquery(plant_ids=None):
+    stmt = select(Care_Events.plant_id, func.max(Care_Events.event_date).label('last_watered'))\
+        .where(func.lower(Care_Events.event_type).like('water%'))
+    if plant_ids is not None:
+        stmt = stmt.where(Care_Events.plant_id.in_(plant_ids))
+    return stmt.group_by(Care_Events.plant_id).subquery('last_watered')
+
+
+def schedule_query(today, user_id=None):
+    # Next-due dates for every plant (or one user's plants), computed entirely in SQL
+    owned = None
+    if user_id is not None:
+        owned = select(plant_owner.c.plant_id).where(plant_owner.c.user_id == user_id)
+    watered = last_watered_subquery(owned)
+
+    next_due = date_add_days(watered.c.last_watered, Species.watering_interval_min_days)
+    overdue_after = date_add_days(watered.c.last_watered, Species.watering_interval_max_days)
+    status = case(
+        (Species.watering_interval_min_days.is_(None), literal('unknown')),
+        (watered.c.last_watered.is_(None), literal('due')),
+        (overdue_after < today, literal('overdue')),
+        (next_due <= today, literal('due')),
+        else_=literal('upcoming')
+    )
+
+    stmt = select(
+        Plants.id,
+        Plants.nickname,
+        Plants.species_id,
+        Species.watering_frequency,
+        watered.c.last_watered,
+        next_due.label('next_due'),
+        overdue_after.label('overdue_after'),
+        status.label('status')
+    ).outerjoin(Species, Species.id == Plants.species_id)\
+     .outerjoin(watered, watered.c.plant_id == Plants.id)
+
+    if owned is not None:
+        stmt = stmt.where(Plants.id.in_(owned))
+    return stmt
+
+
+def watering_schedule(user_id, today, statuses=None):
+    stmt = schedule_query(today, user_id)
+    if statuses:
+        stmt = stmt.where(stmt.selected_columns.status.in_(statuses))
+    stmt = stmt.order_by(stmt.selected_columns.next_due.nulls_first(), Plants.id)
+    return [schedule_row_dict(row) for row in db.session.execute(stmt)]
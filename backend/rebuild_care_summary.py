@@ -0,0 +1,10 @@
+from app import create_app
+from model import db
+from queries import rebuild_care_summary
+
+
+if __name__ == '__main__':
+    with create_app().app_context():
+        db.create_all()
+        count = rebuild_care_summary()
+        print(f"Rebuilt care summary for {count} plants")
@@ -0,0 +1,61 @@
+import threading
+import time
+from sqlalchemy import select, func, text
+from model import db, User, Species, Plants
+
+COUNTED = {'users_count': User, 'species_count': Species, 'plants_count': Plants}
+
+
+def exact_counts():
+    # Still one round trip: the three COUNT(*)s run as scalar subqueries of a single SELECT
+    stmt = select(*[
+        select(func.count()).select_from(model).scalar_subquery().label(key) for key, model in COUNTED.items()
+    ])
+    return dict(db.session.execute(stmt).one()._mapping)
+
+
+def estimated_counts():
+    # Postgres keeps a row estimate per table in pg_class, refreshed by ANALYZE/autovacuum;
+    # reltuples is -1 (or 0 on older versions) until a table has been analyzed
+    if db.session.get_bind().dialect.name != 'postgresql':
+        return None
+    tables = {model.__table__.name: key for key, model in COUNTED.items()}
+    rows = db.session.execute(
+        text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relname = ANY(:names)"),
+        {'names': list(tables)}
+    ).all()
+    estimates = {tables[name]: int(reltuples) for name, reltuples in rows if reltuples >= 0}
+    return estimates if len(estimates) == len(tables) else None
+
+
+class CountCache:
+    """Exact counts refreshed at most every `ttl` seconds; while one caller refreshes, others get the previous value."""
+
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        # (counts, refreshed_at), replaced as a whole so lock-free readers never see half of it
+        self._state = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config['CHECK_DATA_CACHE_TTL']
+        self.invalidate()
+
+    def get(self):
+        state = self._state
+        if state is not None and time.monotonic() - state[1] < self.ttl:
+            return state[0], time.monotonic() - state[1]
+
+        if not self._lock.acquire(blocking=state is None):
+            return state[0], time.monotonic() - state[1]
+        try:
+            state = self._state
+            if state is None or time.monotonic() - state[1] >= self.ttl:
+                state = self._state = (exact_counts(), time.monotonic())
+            return state[0], time.monotonic() - state[1]
+        finally:
+            self._lock.release()
+
+    def invalidate(self):
+        with self._lock:
+            self._state = None
@@ -0,0 +1,112 @@
+import heapq
+import os
+import time
+from datetime import date
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects import postgresql, sqlite
+from app import create_app
+from model import db, Plants, Schedule_Changes, Reminder_Outbox, plant_owner
+from queries import schedule_query
+
+
+CHANGE_CHUNK = 500
+
+
+class ReminderScheduler:
+    """Min-heap of next watering due dates, kept current by consuming schedule_changes."""
+
+    def __init__(self):
+        self.heap = []
+        self.due = {}
+
+    def _schedule(self, plant_ids=None):
+        today = date.today()
+        stmt = schedule_query(today)
+        if plant_ids is not None:
+            stmt = stmt.where(Plants.id.in_(plant_ids))
+
+        for row in db.session.execute(stmt):
+            if row.status == 'unknown':
+                self.due.pop(row.id, None)
+                continue
+            # Never-watered plants with a known interval are due straight away
+            due_date = row.next_due or today
+            if self.due.get(row.id) != due_date:
+                self.due[row.id] = due_date
+                heapq.heappush(self.heap, (due_date, row.id))
+
+    def rebuild(self):
+        self.heap = []
+        self.due = {}
+        # The full recompute below covers every change committed so far; rows committed later
+        # (even with a lower id) survive the delete and are picked up by apply_changes
+        last_change_id = db.session.scalar(select(func.max(Schedule_Changes.id)))
+        if last_change_id is not None:
+            db.session.execute(delete(Schedule_Changes).where(Schedule_Changes.id <= last_change_id))
+        self._schedule()
+        db.session.commit()
+
+    def apply_changes(self):
+        # Serial ids aren't assigned in commit order, so there is no high-water mark to trust:
+        # every poll reads whatever rows remain and deletes exactly the ones it read
+        changes = db.session.execute(select(Schedule_Changes.id, Schedule_Changes.plant_id)).all()
+        if not changes:
+            return 0
+
+        plant_ids = {change.plant_id for change in changes}
+        # Deleted plants won't come back from the query; their stale heap entries are skipped on pop
+        for plant_id in plant_ids:
+            self.due.pop(plant_id, None)
+        self._schedule(plant_ids)
+
+        change_ids = [change.id for change in changes]
+        for offset in range(0, len(change_ids), CHANGE_CHUNK):
+            chunk = change_ids[offset:offset + CHANGE_CHUNK]
+            db.session.execute(delete(Schedule_Changes).where(Schedule_Changes.id.in_(chunk)))
+        db.session.commit()
+        return len(plant_ids)
+
+    def _outbox_insert(self):
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            return postgresql.insert(Reminder_Outbox).on_conflict_do_nothing()
+        if dialect == 'sqlite':
+            return sqlite.insert(Reminder_Outbox).on_conflict_do_nothing()
+        return Reminder_Outbox.__table__.insert()
+
+    def emit_due(self, today=None):
+        today = today or date.today()
+        plant_ids = {}
+        while self.heap and self.heap[0][0] <= today:
+            due_date, plant_id = heapq.heappop(self.heap)
+            if self.due.get(plant_id) != due_date:
+                continue
+            del self.due[plant_id]
+            plant_ids[plant_id] = due_date
+
+        if not plant_ids:
+            return 0
+
+        owners = db.session.execute(
+            select(plant_owner.c.plant_id, plant_owner.c.user_id)
+                .where(plant_owner.c.plant_id.in_(list(plant_ids)))
+        ).all()
+        rows = [{'plant_id': owner.plant_id, 'user_id': owner.user_id, 'due_date': plant_ids[owner.plant_id]}
+                for owner in owners]
+        if rows:
+            db.session.execute(self._outbox_insert(), rows)
+        db.session.commit()
+        return len(rows)
+
+    def run_forever(self, poll_seconds):
+        self.rebuild()
+        while True:
+            self.apply_changes()
+            self.emit_due()
+            time.sleep(poll_seconds)
+
+
+if __name__ == '__main__':
+    with create_app().app_context():
+        db.create_all()
+        ReminderScheduler().run_forever(int(os.environ.get('SCHEDULER_POLL_SECONDS', 60)))
@@ -1,19 +1,75 @@
 import os
-from app import app, db
-from model import User, Species, Plants, Care_Events
 from datetime import date
+from sqlalchemy import insert, select
+from model import db, User, Species, Plants, plant_owner
+from import_data import import_records
+
+SEED_PASSWORD = 'password123'
+
+SEED_USERS = [
+    {'username': 'plant_lover', 'email': 'plantlover@email.com', 'password': SEED_PASSWORD},
+    {'username': 'green_thumb', 'email': 'greenthumb@email.com', 'password': SEED_PASSWORD},
+    {'username': 'urban_gardener', 'email': 'gardener@email.com', 'password': SEED_PASSWORD}
+]
+
+SEED_SPECIES = [
+    {'common_name': 'Snake Plant', 'scientific_name': 'Dracaena trifasciata', 'watering_frequency': 'Every 2-3 weeks'},
+    {'common_name': 'Peace Lily', 'scientific_name': 'Spathiphyllum', 'watering_frequency': 'Weekly'},
+    {'common_name': 'Spider Plant', 'scientific_name': 'Chlorophytum comosum', 'watering_frequency': 'Every 1-2 weeks'}
+]
+
+# (nickname, scientific name, owner username)
+SEED_PLANTS = [
+    ('Snakey', 'Dracaena trifasciata', 'plant_lover'),
+    ('Lily', 'Spathiphyllum', 'plant_lover'),
+    ('Spidey', 'Chlorophytum comosum', 'green_thumb'),
+    ('Green Giant', 'Dracaena trifasciata', 'urban_gardener')
+]
+
+# (plant nickname, username, event type, date, notes)
+SEED_CARE_EVENTS = [
+    ('Snakey', 'plant_lover', 'watering', date(2024, 1, 15), 'First watering'),
+    ('Lily', 'green_thumb', 'fertilizing', date(2024, 1, 10), 'Organic fertilizer')
+]
+
+
+def load_seed_data():
+    # Users and species go through the bulk import pipeline (parallel hashing, chunked inserts)
+    import_records('users', SEED_USERS, verbose=False)
+    import_records('species', SEED_SPECIES, verbose=False)
+
+    user_ids = dict(db.session.execute(
+        select(User.username, User.id).where(User.username.in_([u['username'] for u in SEED_USERS]))
+    ).all())
+    species_ids = dict(db.session.execute(
+        select(Species.scientific_name, Species.id).where(Species.scientific_name.in_([s['scientific_name'] for s in SEED_SPECIES]))
+    ).all())
+
+    plant_ids = db.session.scalars(insert(Plants).returning(Plants.id, sort_by_parameter_order=True), [
+        {'nickname': nickname, 'species_id': species_ids[scientific_name]}
+        for nickname, scientific_name, _ in SEED_PLANTS
+    ]).all()
+    db.session.execute(insert(plant_owner), [
+        {'user_id': user_ids[username], 'plant_id': plant_id}
+        for (_, _, username), plant_id in zip(SEED_PLANTS, plant_ids)
+    ])
+    db.session.commit()
+
+    plants_by_name = {nickname: plant_id for (nickname, _, _), plant_id in zip(SEED_PLANTS, plant_ids)}
+    import_records('care-events', [
+        {'event_type': event_type, 'event_date': event_date, 'user_id': user_ids[username],
+         'plant_id': plants_by_name[nickname], 'notes': notes}
+        for nickname, username, event_type, event_date, notes in SEED_CARE_EVENTS
+    ], verbose=False)
+
 
 def seed_database():
     if os.path.exists('app.db'):
         os.remove('app.db')
         print("Removed old database")
     
-    if os.path.exists('migrations'):
-        import shutil
-        shutil.rmtree('migrations')
-        print("Removed migrations folder")
-    
-    with app.app_context():
+    from app import create_app
+    with create_app().app_context():
         print("Creating all tables...")
         db.create_all()
         
@@ -27,82 +83,13 @@ def seed_database():
             return
         
         print("Creating seed data with passwords...")
-        
-        users = [
-            User(username='plant_lover', email='plantlover@email.com'),
-            User(username='green_thumb', email='greenthumb@email.com'),
-            User(username='urban_gardener', email='gardener@email.com')
-        ]
-
-        for user in users:
-            user.set_password('password123')
-            print("Set password for", user.username)
-
-        species = [
-            Species(
-                common_name='Snake Plant', 
-                scientific_name='Dracaena trifasciata', 
-                watering_frequency='Every 2-3 weeks'
-            ),
-            Species(
-                common_name='Peace Lily', 
-                scientific_name='Spathiphyllum', 
-                watering_frequency='Weekly'
-            ),
-            Species(
-                common_name='Spider Plant', 
-                scientific_name='Chlorophytum comosum', 
-                watering_frequency='Every 1-2 weeks'
-            )
-        ]
-        
-        db.session.add_all(users)
-        db.session.add_all(species)
-        db.session.commit()
-        print("Added users and species")
-        
-        plants = [
-            Plants(nickname='Snakey', species_id=species[0].id),
-            Plants(nickname='Lily', species_id=species[1].id),
-            Plants(nickname='Spidey', species_id=species[2].id),
-            Plants(nickname='Green Giant', species_id=species[0].id)
-        ]
-        
-        care_events = [
-            Care_Events(
-                event_type='watering',
-                notes='First watering',
-                event_date=date(2024, 1, 15), 
-                user_id=users[0].id,
-                plant_id=1
-            ),
-            Care_Events(
-                event_type='fertilizing',
-                notes='Organic fertilizer',
-                event_date=date(2024, 1, 10), 
-                user_id=users[1].id,
-                plant_id=2
-            )
-        ]
-        
-        db.session.add_all(plants)
-        db.session.add_all(care_events)
-        db.session.commit()
-        print("Added plants and care events")
-        
-        plants[0].users.append(users[0])
-        plants[1].users.append(users[0]) 
-        plants[2].users.append(users[1]) 
-        plants[3].users.append(users[2])
-
-        db.session.commit()
-        print("Set up plant ownership")
+        load_seed_data()
+        print("Added users, species, plants and care events")
         
         print("Database reset and seeded successfully!")
         print("Test users created:")
-        print("Username: plant_lover, Password: password123")
-        print("Username: green_thumb, Password: password123")
-        print("Username: urban_gardener, Password: password123")
+        for user in SEED_USERS:
+            print(f"Username: {user['username']}, Password: {user['password']}")
 
 if __name__ == '__main__':
-    seed_database()
\ No newline at end of file
+    seed_database()
@@ -0,0 +1,62 @@
+import json
+from flask import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(payload):
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(payload, status=200):
+    return Response(dumps(payload), status=status, mimetype='application/json')
+
+
+def species_dict(id, common_name, scientific_name, watering_frequency):
+    if id is None:
+        return None
+    return {
+        'id': id,
+        'common_name': common_name,
+        'scientific_name': scientific_name,
+        'watering_frequency': watering_frequency
+    }
+
+
+def species_row_dict(row):
+    return species_dict(row.id, row.common_name, row.scientific_name, row.watering_frequency)
+
+
+def plant_row_dict(row):
+    # Row shape: plant id/nickname/species_id plus species columns labelled s_id, common_name, ...
+    return {
+        'id': row.id,
+        'nickname': row.nickname,
+        'species_id': row.species_id,
+        'species': species_dict(row.s_id, row.common_name, row.scientific_name, row.watering_frequency)
+    }
+
+
+def dashboard_row_dict(row):
+    plant = plant_row_dict(row)
+    plant['last_care_date'] = row.last_care_date.isoformat() if row.last_care_date else None
+    plant['last_care_type'] = row.last_care_type
+    return plant
+
+
+def schedule_row_dict(row):
+    return {
+        'plant_id': row.id,
+        'nickname': row.nickname,
+        'species_id': row.species_id,
+        'watering_frequency': row.watering_frequency,
+        'last_watered_date': row.last_watered.isoformat() if row.last_watered else None,
+        'next_due_date': row.next_due.isoformat() if row.next_due else None,
+        'overdue_after': row.overdue_after.isoformat() if row.overdue_after else None,
+        'status': row.status
+    }
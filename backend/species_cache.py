@@ -0,0 +1,84 @@
+import hashlib
+import threading
+import time
+from sqlalchemy import select, func
+from model import db, Species
+from queries import all_species
+from serializers import dumps
+
+
+def version_query():
+    # Species are insert-only, so row count and max id change on every create_species commit
+    return select(func.count(Species.id), func.max(Species.id))
+
+
+def catalog_version(count, max_id):
+    return f"{count}-{max_id or 0}"
+
+
+class SpeciesCatalog:
+    """Pre-serialized species catalog, revalidated against a cheap version query every `ttl` seconds."""
+
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        # (checked_at, version, snapshot), always replaced as a whole so lock-free readers
+        # never see a snapshot without its check time
+        self._state = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config['SPECIES_CACHE_TTL']
+        self.invalidate()
+
+    @property
+    def version(self):
+        state = self._state
+        return state[1] if state is not None else None
+
+    @staticmethod
+    def _entry(payload):
+        body = dumps(payload)
+        return body, hashlib.sha1(body).hexdigest()
+
+    def _current_version(self):
+        return catalog_version(*db.session.execute(version_query()).one())
+
+    def _fresh_snapshot(self):
+        state = self._state
+        if state is not None and time.monotonic() - state[0] < self.ttl:
+            return state[2]
+        return None
+
+    def _matching_snapshot(self, version):
+        state = self._state
+        return state[2] if state is not None and state[1] == version else None
+
+    def _build(self, species):
+        items = {specie['id']: self._entry(specie) for specie in species}
+        return self._entry(species), items
+
+    def _store(self, version, snapshot):
+        self._state = (time.monotonic(), version, snapshot)
+        return snapshot
+
+    def _refresh(self):
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            version = self._current_version()
+            snapshot = self._matching_snapshot(version)
+            if snapshot is None:
+                snapshot = self._build(all_species())
+            return self._store(version, snapshot)
+
+    def catalog(self):
+        return self._refresh()[0]
+
+    def item(self, species_id):
+        return self._refresh()[1].get(species_id)
+
+    def invalidate(self):
+        with self._lock:
+            self._state = None
@@ -0,0 +1,102 @@
+from sqlalchemy import DDL, event, text
+from model import db, Species
+from serializers import species_row_dict
+
+# SQLite: external-content FTS5 table with the trigram tokenizer, kept in sync by triggers
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS species_fts USING fts5(
+        common_name, scientific_name, content='species', content_rowid='id', tokenize='trigram')""",
+    """CREATE TRIGGER IF NOT EXISTS species_fts_insert AFTER INSERT ON species BEGIN
+        INSERT INTO species_fts(rowid, common_name, scientific_name)
+        VALUES (new.id, new.common_name, new.scientific_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS species_fts_delete AFTER DELETE ON species BEGIN
+        INSERT INTO species_fts(species_fts, rowid, common_name, scientific_name)
+        VALUES ('delete', old.id, old.common_name, old.scientific_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS species_fts_update AFTER UPDATE ON species BEGIN
+        INSERT INTO species_fts(species_fts, rowid, common_name, scientific_name)
+        VALUES ('delete', old.id, old.common_name, old.scientific_name);
+        INSERT INTO species_fts(rowid, common_name, scientific_name)
+        VALUES (new.id, new.common_name, new.scientific_name);
+    END""",
+]
+
+# Postgres: pg_trgm GIN indexes serve ILIKE prefixes and word-similarity lookups
+POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_species_common_name_trgm ON species USING gin (common_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_species_scientific_name_trgm ON species USING gin (scientific_name gin_trgm_ops)",
+]
+
+for statement in SQLITE_DDL:
+    event.listen(Species.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+for statement in POSTGRES_DDL:
+    event.listen(Species.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+
+
+def _fts_query(q, limit, match):
+    return db.session.execute(text("""
+        SELECT s.id, s.common_name, s.scientific_name, s.watering_frequency
+        FROM species_fts
+        JOIN species s ON s.id = species_fts.rowid
+        WHERE species_fts MATCH :match
+        ORDER BY (lower(s.common_name) LIKE :prefix OR lower(s.scientific_name) LIKE :prefix) DESC,
+                 bm25(species_fts)
+        LIMIT :limit
+    """), {'match': match, 'prefix': q + '%', 'limit': limit}).all()
+
+
+def _search_sqlite(q, limit):
+    q = q.lower().replace('"', '')
+    if len(q) < 3:
+        return _search_like(q, limit)
+
+    # Substring match first (selective and cheap); fall back to OR-ing the query's
+    # trigrams so a typo only costs the few trigrams it touches
+    rows = _fts_query(q, limit, f'"{q}"')
+    if len(rows) < limit:
+        trigrams = sorted({q[i:i + 3] for i in range(len(q) - 2)})
+        fuzzy = _fts_query(q, limit, ' OR '.join(f'"{trigram}"' for trigram in trigrams))
+        seen = {row.id for row in rows}
+        rows += [row for row in fuzzy if row.id not in seen][:limit - len(rows)]
+    return rows
+
+
+def _search_postgres(q, limit):
+    return db.session.execute(text("""
+        SELECT id, common_name, scientific_name, watering_frequency
+        FROM species
+        WHERE common_name ILIKE :prefix OR scientific_name ILIKE :prefix
+           OR :q <% common_name OR :q <% scientific_name
+        ORDER BY (common_name ILIKE :prefix OR scientific_name ILIKE :prefix) DESC,
+                 greatest(word_similarity(:q, common_name), word_similarity(:q, scientific_name)) DESC,
+                 id
+        LIMIT :limit
+    """), {'q': q, 'prefix': q.replace('%', r'\%') + '%', 'limit': limit}).all()
+
+
+def _search_like(q, limit):
+    prefix = q.replace('%', r'\%') + '%'
+    return db.session.execute(
+        db.select(Species.id, Species.common_name, Species.scientific_name, Species.watering_frequency)
+            .where(Species.common_name.ilike(prefix, escape='\\') | Species.scientific_name.ilike(prefix, escape='\\'))
+            .order_by(Species.common_name)
+            .limit(limit)
+    ).all()
+
+
+def search_species(q, limit=20):
+    # Ranked rows already carry the payload columns, so the search is a single round trip
+    q = q.strip()
+    if not q:
+        return []
+
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        rows = _search_sqlite(q, limit)
+    elif dialect == 'postgresql':
+        rows = _search_postgres(q, limit)
+    else:
+        rows = _search_like(q, limit)
+    return [species_row_dict(row) for row in rows]
@@ -0,0 +1,113 @@
+from sqlalchemy import select, func, case, literal
+from model import db, Plants, Species, Care_Events, plant_owner
+from queries import days_between, last_watered_subquery
+
+WATERING = func.lower(Care_Events.event_type).like('water%')
+
+
+def _owned(user_id):
+    return select(plant_owner.c.plant_id).where(plant_owner.c.user_id == user_id)
+
+
+def _event_totals(user_id):
+    stmt = select(
+        Plants.species_id,
+        func.count(Care_Events.id).label('events'),
+        func.min(Care_Events.event_date).label('first_event'),
+        func.max(Care_Events.event_date).label('last_event')
+    ).join(Plants, Plants.id == Care_Events.plant_id)\
+     .where(Care_Events.plant_id.in_(_owned(user_id)))\
+     .group_by(Plants.species_id)
+    return {row.species_id: row for row in db.session.execute(stmt)}
+
+
+def _watering_gaps(user_id):
+    # LAG over each plant's waterings gives the interval since the previous one
+    previous = func.lag(Care_Events.event_date).over(
+        partition_by=Care_Events.plant_id, order_by=Care_Events.event_date
+    )
+    waterings = select(
+        Care_Events.plant_id,
+        days_between(Care_Events.event_date, previous).label('gap')
+    ).where(WATERING, Care_Events.plant_id.in_(_owned(user_id))).subquery()
+
+    gap = waterings.c.gap
+    on_time = case((gap <= Species.watering_interval_max_days, literal(1)), else_=literal(0))
+
+    stmt = select(
+        Plants.species_id,
+        func.count(gap).label('intervals'),
+        func.sum(gap).label('interval_days'),
+        func.max(gap).label('longest_gap'),
+        func.sum(case((Species.watering_interval_max_days.isnot(None), on_time))).label('on_time'),
+        func.count(case((Species.watering_interval_max_days.isnot(None), gap))).label('scored')
+    ).select_from(waterings)\
+     .join(Plants, Plants.id == waterings.c.plant_id)\
+     .outerjoin(Species, Species.id == Plants.species_id)\
+     .where(gap.isnot(None))\
+     .group_by(Plants.species_id)
+    return {row.species_id: row for row in db.session.execute(stmt)}
+
+
+def _current_gaps(user_id, today):
+    watered = last_watered_subquery(_owned(user_id))
+    stmt = select(
+        Plants.species_id,
+        func.max(days_between(literal(today), watered.c.last_watered)).label('current_gap')
+    ).join(Plants, Plants.id == watered.c.plant_id)\
+     .group_by(Plants.species_id)
+    return {row.species_id: row.current_gap for row in db.session.execute(stmt)}
+
+
+def _summarize(events, first_event, last_event, intervals, interval_days, on_time, scored, longest):
+    weeks = ((last_event - first_event).days + 1) / 7 if events else 0
+    return {
+        'events': events,
+        'events_per_week': round(events / max(weeks, 1), 2) if events else 0,
+        'mean_watering_interval_days': round(interval_days / intervals, 2) if intervals else None,
+        'watering_adherence': round(on_time / scored, 3) if scored else None,
+        'longest_neglect_days': longest
+    }
+
+
+def care_stats(user_id, today):
+    totals = _event_totals(user_id)
+    gaps = _watering_gaps(user_id)
+    current = _current_gaps(user_id, today)
+
+    species_ids = set(totals) | set(gaps) | set(current)
+    names = dict(db.session.execute(
+        select(Species.id, Species.common_name).where(Species.id.in_([s for s in species_ids if s is not None]))
+    ).all())
+
+    # Per-species rows are already aggregated in SQL; the per-user figures just sum them
+    per_species = []
+    user_totals = dict(events=0, first_event=None, last_event=None, intervals=0,
+                       interval_days=0, on_time=0, scored=0, longest=None)
+    for species_id in sorted(species_ids, key=lambda s: (s is None, s)):
+        total = totals.get(species_id)
+        gap = gaps.get(species_id)
+        longest = max([value for value in (gap and gap.longest_gap, current.get(species_id)) if value is not None],
+                      default=None)
+        parts = dict(
+            events=total.events if total else 0,
+            first_event=total.first_event if total else None,
+            last_event=total.last_event if total else None,
+            intervals=gap.intervals if gap else 0,
+            interval_days=(gap.interval_days or 0) if gap else 0,
+            on_time=(gap.on_time or 0) if gap else 0,
+            scored=gap.scored if gap else 0,
+            longest=longest
+        )
+        per_species.append({'species_id': species_id, 'common_name': names.get(species_id), **_summarize(**parts)})
+
+        for key in ('events', 'intervals', 'interval_days', 'on_time', 'scored'):
+            user_totals[key] += parts[key]
+        if parts['first_event'] and (user_totals['first_event'] is None or parts['first_event'] < user_totals['first_event']):
+            user_totals['first_event'] = parts['first_event']
+        if parts['last_event'] and (user_totals['last_event'] is None or parts['last_event'] > user_totals['last_event']):
+            user_totals['last_event'] = parts['last_event']
+        if longest is not None and (user_totals['longest'] is None or longest > user_totals['longest']):
+            user_totals['longest'] = longest
+
+    return {'user': _summarize(**user_totals), 'species': per_species}
@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import insert
+from app import create_app, create_jwt_token
+from model import db, User, Species, Plants, plant_owner
+
+
+@pytest.fixture
+def app_config():
+    # Overridden by modules that need a different database or feature flags
+    return {'SQLALCHEMY_DATABASE_URI': 'sqlite://'}
+
+
+@pytest.fixture
+def app(app_config):
+    app = create_app(app_config)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Species(id=1, common_name='Snake Plant', scientific_name='Dracaena trifasciata',
+                               watering_frequency='Every 2-3 weeks'))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    # Returns (user_id, auth headers); password hashing is skipped since tests use tokens directly
+    def make_user(username):
+        user = User(username=username, email=f'{username}@example.com', password_hash='unused')
+        db.session.add(user)
+        db.session.commit()
+        return user.id, {'Authorization': f'Bearer {create_jwt_token(user.id)}'}
+    return make_user
+
+
+@pytest.fixture
+def make_plant(app):
+    def make_plant(*owner_ids, species_id=1):
+        plant = Plants(nickname='Fern', species_id=species_id)
+        db.session.add(plant)
+        db.session.flush()
+        if owner_ids:
+            db.session.execute(insert(plant_owner), [{'user_id': user_id, 'plant_id': plant.id} for user_id in owner_ids])
+        db.session.commit()
+        return plant.id
+    return make_plant
@@ -0,0 +1,65 @@
+from datetime import date
+import time
+import pytest
+from sqlalchemy import select, func
+from app import care_event_buffer
+from model import db, Care_Events, Care_Summary
+from queries import delete_plants
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    # The writer thread has its own connection, so the database has to outlive a single connection
+    return {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "app.db"}', 'CARE_EVENT_WRITE_BEHIND': True,
+            'CARE_EVENT_FLUSH_MS': 60000}
+
+
+@pytest.fixture
+def buffer(app):
+    yield care_event_buffer
+    care_event_buffer.close()
+
+
+def care_event_count(plant_id):
+    db.session.rollback()
+    return db.session.scalar(select(func.count(Care_Events.id)).where(Care_Events.plant_id == plant_id))
+
+
+def test_flush_writes_the_open_batch_without_waiting_for_its_deadline(client, buffer, make_user, make_plant):
+    user_id, headers = make_user('alice')
+    plant_id = make_plant(user_id)
+
+    response = client.post(f'/plants/{plant_id}/care_events', json={'event_type': 'watering'}, headers=headers)
+    assert response.status_code == 202
+
+    started = time.monotonic()
+    buffer.flush()
+    assert time.monotonic() - started < 5
+    assert care_event_count(plant_id) == 1
+
+
+def test_deleting_a_plant_leaves_no_buffered_events_behind(client, buffer, make_user, make_plant):
+    user_id, headers = make_user('alice')
+    plant_id = make_plant(user_id)
+
+    client.post(f'/plants/{plant_id}/care_events', json={'event_type': 'watering'}, headers=headers)
+    assert client.delete(f'/plants/{plant_id}', headers=headers).status_code == 200
+    assert care_event_count(plant_id) == 0
+
+
+def test_events_for_a_plant_deleted_before_the_write_are_dropped(app, buffer, make_user, make_plant):
+    user_id, _ = make_user('alice')
+    plant_id, other_id = make_plant(user_id), make_plant(user_id)
+    dropped = buffer.dropped
+
+    for target in (plant_id, other_id):
+        buffer.submit({'event_type': 'watering', 'event_date': date.today(),
+                       'user_id': user_id, 'plant_id': target, 'notes': ''})
+    delete_plants([plant_id])
+    db.session.commit()
+    buffer.flush()
+
+    assert care_event_count(plant_id) == 0
+    assert care_event_count(other_id) == 1
+    assert db.session.get(Care_Summary, plant_id) is None
+    assert buffer.dropped == dropped + 1
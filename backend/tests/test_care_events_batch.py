@@ -0,0 +1,40 @@
+from model import db, Care_Events
+
+
+def test_batch_reports_invalid_items_without_failing_the_rest(client, make_user, make_plant):
+    user_id, headers = make_user('ana')
+    other_id, _ = make_user('ben')
+    plant_id = make_plant(user_id)
+    foreign_plant_id = make_plant(other_id)
+
+    response = client.post('/care_events/batch', headers=headers, json={'events': [
+        {'plant_id': plant_id, 'event_type': 'watering'},
+        {'plant_id': plant_id, 'event_type': {'x': 1}},
+        {'plant_id': plant_id, 'event_type': 'watering', 'notes': ['a']},
+        {'plant_id': plant_id, 'event_type': 'w' * 51},
+        {'plant_id': True, 'event_type': 'watering'},
+        {'plant_id': plant_id, 'event_type': ''},
+        {'plant_id': foreign_plant_id, 'event_type': 'watering'},
+        {'plant_id': plant_id, 'event_type': 'watering', 'event_date': 'yesterday'},
+        {'plant_id': plant_id, 'event_type': 'fertilizing', 'notes': None, 'event_date': '2024-05-01'},
+    ]})
+
+    assert response.status_code == 207
+    body = response.get_json()
+    assert [result['status'] for result in body['results']] == [201, 400, 400, 400, 400, 400, 403, 400, 201]
+    assert body['created'] == 2
+    assert db.session.query(Care_Events).filter_by(plant_id=plant_id).count() == 2
+
+
+def test_batch_with_only_invalid_items_is_a_400(client, make_user, make_plant):
+    user_id, headers = make_user('ana')
+    plant_id = make_plant(user_id)
+
+    response = client.post('/care_events/batch', headers=headers, json={'events': [
+        {'plant_id': plant_id, 'event_type': 7},
+    ]})
+
+    assert response.status_code == 400
+    assert response.get_json()['results'] == [
+        {'index': 0, 'status': 400, 'message': 'plant_id and event_type are required'}
+    ]
@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+from sqlalchemy import event, insert
+from app import create_jwt_token
+from model import db, User, Plants, Care_Events, plant_owner
+from queries import rebuild_care_summary
+
+
+def add_user_with_plants(username, plant_count):
+    user = User(username=username, email=f'{username}@example.com', password_hash='unused')
+    db.session.add(user)
+    db.session.commit()
+
+    for i in range(plant_count):
+        plant = Plants(nickname=f'{username} plant {i}', species_id=1 if i % 2 else None)
+        db.session.add(plant)
+        db.session.flush()
+        db.session.execute(insert(plant_owner), {'user_id': user.id, 'plant_id': plant.id})
+        db.session.add_all([
+            Care_Events(event_type='watering', event_date=date(2024, 1, 1) + timedelta(days=day),
+                        user_id=user.id, plant_id=plant.id)
+            for day in range(3)
+        ])
+    db.session.commit()
+    rebuild_care_summary()
+    return create_jwt_token(user.id)
+
+
+def dashboard_statement_count(client, token):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'after_cursor_execute', listener)
+    try:
+        response = client.get('/dashboard', headers={'Authorization': f'Bearer {token}'})
+    finally:
+        event.remove(db.engine, 'after_cursor_execute', listener)
+    return response, len(statements)
+
+
+def test_dashboard_statement_count_is_independent_of_plant_count(client):
+    few_token = add_user_with_plants('few', 1)
+    many_token = add_user_with_plants('many', 100)
+
+    few, few_count = dashboard_statement_count(client, few_token)
+    many, many_count = dashboard_statement_count(client, many_token)
+
+    assert few.status_code == 200 and few.get_json()['plants_count'] == 1
+    assert many.status_code == 200 and many.get_json()['plants_count'] == 100
+    assert many.get_json()['plants'][1]['species']['common_name'] == 'Snake Plant'
+    assert many.get_json()['plants'][0]['last_care_date'] == '2024-01-03'
+    assert many_count == few_count
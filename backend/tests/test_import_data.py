@@ -0,0 +1,16 @@
+from sqlalchemy import select
+from model import db, Schedule_Changes
+from import_data import import_records
+
+
+def test_care_event_import_marks_each_plant_for_the_scheduler(make_user, make_plant):
+    user_id, _ = make_user('alice')
+    first, second = make_plant(user_id), make_plant(user_id)
+    records = [{'event_type': 'watering', 'event_date': f'2024-01-0{day}', 'user_id': str(user_id), 'plant_id': str(plant_id)}
+               for day in (1, 2) for plant_id in (first, second)]
+
+    assert import_records('care-events', records, chunk_size=2, verbose=False) == 4
+
+    # Two chunks, each touching both plants once
+    dirty = db.session.scalars(select(Schedule_Changes.plant_id)).all()
+    assert sorted(dirty) == sorted([first, second] * 2)
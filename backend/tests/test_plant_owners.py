@@ -0,0 +1,65 @@
+import pytest
+
+
+@pytest.fixture
+def owners(make_user, make_plant):
+    # ana created the plant; ben and cai are not owners yet
+    ana, ana_headers = make_user('ana')
+    ben, ben_headers = make_user('ben')
+    cai, cai_headers = make_user('cai')
+    plant_id = make_plant(ana)
+    return plant_id, (ana, ana_headers), (ben, ben_headers), (cai, cai_headers)
+
+
+def owner_ids(client, plant_id, headers):
+    return [owner['id'] for owner in client.get(f'/plants/{plant_id}/owners', headers=headers).get_json()['owners']]
+
+
+def test_non_owners_are_forbidden(client, owners):
+    plant_id, _, (_, ben_headers), (cai, _) = owners
+
+    assert client.post(f'/plants/{plant_id}/care_events', headers=ben_headers,
+                       json={'event_type': 'watering'}).status_code == 403
+    assert client.get(f'/plants/{plant_id}/care_events', headers=ben_headers).status_code == 403
+    assert client.get(f'/plants/{plant_id}/owners', headers=ben_headers).status_code == 403
+    assert client.post(f'/plants/{plant_id}/owners', headers=ben_headers, json={'username': 'cai'}).status_code == 403
+    assert client.delete(f'/plants/{plant_id}/owners/{cai}', headers=ben_headers).status_code == 403
+
+
+def test_sharing_grants_access(client, owners):
+    plant_id, (ana, ana_headers), (ben, ben_headers), _ = owners
+
+    assert client.post(f'/plants/{plant_id}/owners', headers=ana_headers, json={'username': 'ben'}).status_code == 201
+    assert client.post(f'/plants/{plant_id}/owners', headers=ana_headers, json={'username': 'ben'}).status_code == 200
+    assert client.post(f'/plants/{plant_id}/care_events', headers=ben_headers,
+                       json={'event_type': 'watering'}).status_code == 201
+    assert owner_ids(client, plant_id, ben_headers) == [ana, ben]
+
+
+def test_sharee_cannot_remove_earlier_owners(client, owners):
+    plant_id, (ana, ana_headers), (ben, ben_headers), (cai, cai_headers) = owners
+    client.post(f'/plants/{plant_id}/owners', headers=ana_headers, json={'username': 'ben'})
+    client.post(f'/plants/{plant_id}/owners', headers=ben_headers, json={'username': 'cai'})
+
+    assert client.delete(f'/plants/{plant_id}/owners/{ana}', headers=ben_headers).status_code == 403
+    assert client.delete(f'/plants/{plant_id}/owners/{ben}', headers=cai_headers).status_code == 403
+    assert client.delete(f'/plants/{plant_id}/owners/{cai}', headers=ben_headers).status_code == 200
+    assert client.delete(f'/plants/{plant_id}/owners/{ben}', headers=ana_headers).status_code == 200
+    assert owner_ids(client, plant_id, ana_headers) == [ana]
+
+
+def test_owner_can_leave_but_not_as_the_last_one(client, owners):
+    plant_id, (ana, ana_headers), (ben, ben_headers), _ = owners
+
+    assert client.delete(f'/plants/{plant_id}/owners/{ana}', headers=ana_headers).status_code == 409
+    client.post(f'/plants/{plant_id}/owners', headers=ana_headers, json={'username': 'ben'})
+    assert client.delete(f'/plants/{plant_id}/owners/{ben}', headers=ben_headers).status_code == 200
+    assert client.get(f'/plants/{plant_id}/care_events', headers=ben_headers).status_code == 403
+
+
+def test_removing_a_non_owner_is_a_404(client, owners):
+    plant_id, (_, ana_headers), _, (cai, _) = owners
+
+    response = client.delete(f'/plants/{plant_id}/owners/{cai}', headers=ana_headers)
+    assert response.status_code == 404
+    assert response.get_json()['message'] == 'User does not own this plant'
@@ -0,0 +1,13 @@
+from sqlalchemy import text
+from model import db
+from generate_data import build_parser, generate
+from check_query_plans import hot_queries, sequential_scans
+
+
+def test_hot_queries_avoid_sequential_scans_on_seeded_data(app):
+    generate(build_parser().parse_args(['--users', '20', '--species', '50', '--events-per-plant', '10']))
+    db.session.execute(text('ANALYZE'))
+    db.session.commit()
+
+    scans = {name: sequential_scans(stmt, force_index=False) for name, stmt in hot_queries().items()}
+    assert {name: found for name, found in scans.items() if found} == {}
@@ -0,0 +1,54 @@
+import shutil
+import pytest
+from app import create_app, replica_router
+from model import db
+
+
+@pytest.fixture
+def replicated_app(tmp_path):
+    # The replica is a copy taken before any user exists, i.e. one that lags forever
+    primary, replica = tmp_path / 'primary.db', tmp_path / 'replica.db'
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{primary}',
+        'SQLALCHEMY_REPLICA_URIS': [f'sqlite:///{replica}'],
+        'BCRYPT_LOG_ROUNDS': 4,
+        'BCRYPT_POOL_SIZE': 0,
+    })
+    with app.app_context():
+        db.create_all()
+        db.session.remove()
+    shutil.copy(primary, replica)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+    for engine in replica_router.engines:
+        engine.dispose()
+    replica_router.set_replicas([])
+
+
+def register(client, username):
+    response = client.post('/register', json={'username': username, 'email': f'{username}@example.com',
+                                              'password': 'secret123'})
+    assert response.status_code == 201
+    return {'Authorization': f"Bearer {response.get_json()['token']}"}
+
+
+def test_fresh_token_reads_from_the_primary_on_any_worker(replicated_app):
+    client = replicated_app.test_client()
+    headers = register(client, 'ana')
+    # Another worker never saw the write, so it has no per-process stickiness for this user
+    replica_router._recent_writers.clear()
+
+    assert client.get('/dashboard', headers=headers).status_code == 200
+    assert replica_router.stats()['replica_reads'] == 0
+
+
+def test_user_missing_on_the_replica_is_retried_on_the_primary(replicated_app):
+    replicated_app.config['REPLICA_STICKY_SECONDS'] = 0
+    replica_router.sticky_seconds = 0
+    client = replicated_app.test_client()
+    headers = register(client, 'ana')
+
+    assert client.get('/dashboard', headers=headers).status_code == 200
+    assert client.get('/check-auth', headers=headers).get_json()['authenticated'] is True
+    assert replica_router.stats()['replica_reads'] > 0
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+from sqlalchemy import select, func
+from model import db, Care_Events, Schedule_Changes, Reminder_Outbox
+from scheduler import ReminderScheduler
+
+# conftest's species 1 waters 'Every 2-3 weeks'
+MIN_DAYS = 14
+
+
+def water(plant_id, user_id, event_date):
+    db.session.add(Care_Events(event_type='watering', event_date=event_date, user_id=user_id, plant_id=plant_id))
+    db.session.commit()
+
+
+def outbox():
+    return sorted(db.session.execute(select(Reminder_Outbox.plant_id, Reminder_Outbox.user_id, Reminder_Outbox.due_date)).all())
+
+
+def test_rebuild_schedules_every_plant_and_clears_pending_changes(make_user, make_plant):
+    user_id, _ = make_user('alice')
+    watered, never_watered = make_plant(user_id), make_plant(user_id)
+    no_species = make_plant(user_id, species_id=None)
+    water(watered, user_id, date(2024, 1, 1))
+    db.session.add(Schedule_Changes(plant_id=watered))
+    db.session.commit()
+
+    scheduler = ReminderScheduler()
+    scheduler.rebuild()
+
+    # Never-watered plants are due today; plants without a known interval aren't scheduled
+    assert scheduler.due == {watered: date(2024, 1, 1) + timedelta(days=MIN_DAYS), never_watered: date.today()}
+    assert no_species not in scheduler.due
+    assert db.session.scalar(select(func.count(Schedule_Changes.id))) == 0
+
+
+def test_apply_changes_reschedules_a_plant_after_a_care_event(client, make_user, make_plant):
+    user_id, headers = make_user('alice')
+    plant_id = make_plant(user_id)
+    scheduler = ReminderScheduler()
+    scheduler.rebuild()
+    assert scheduler.due[plant_id] == date.today()
+
+    response = client.post(f'/plants/{plant_id}/care_events', json={'event_type': 'watering'}, headers=headers)
+    assert response.status_code == 201
+
+    assert scheduler.apply_changes() == 1
+    assert scheduler.due[plant_id] == date.today() + timedelta(days=MIN_DAYS)
+    assert scheduler.apply_changes() == 0
+
+
+def test_deleted_plant_is_dropped_and_never_emitted(client, make_user, make_plant):
+    user_id, headers = make_user('alice')
+    plant_id = make_plant(user_id)
+    scheduler = ReminderScheduler()
+    scheduler.rebuild()
+
+    assert client.delete(f'/plants/{plant_id}', headers=headers).status_code == 200
+    assert scheduler.apply_changes() == 1
+
+    assert plant_id not in scheduler.due
+    assert scheduler.emit_due() == 0
+    assert outbox() == []
+
+
+def test_emit_due_writes_one_reminder_per_owner_and_skips_duplicates(make_user, make_plant):
+    alice, _ = make_user('alice')
+    bob, _ = make_user('bob')
+    plant_id = make_plant(alice, bob)
+    today = date.today()
+
+    scheduler = ReminderScheduler()
+    scheduler.rebuild()
+    assert scheduler.emit_due(today) == 2
+    assert scheduler.emit_due(today) == 0
+
+    # A restarted scheduler re-emits the same due date; the outbox keeps one row per plant, user and date
+    restarted = ReminderScheduler()
+    restarted.rebuild()
+    restarted.emit_due(today)
+    assert outbox() == [(plant_id, alice, today), (plant_id, bob, today)]
@@ -0,0 +1,20 @@
+import pytest
+from watering import parse_watering_frequency
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Every 2-3 weeks', (14, 21)),
+    ('Weekly', (7, 7)),
+    ('Twice a week', (4, 4)),
+    ('2-3 times per week', (2, 4)),
+    ('Every week', (7, 7)),
+    ('every other day', (2, 2)),
+    ('Every few days', (None, None)),
+    ('days', (None, None)),
+    ('Every 2 weeks in summer, monthly in winter', (14, 30)),
+    ('weekly to biweekly', (7, 14)),
+    ('Keep moist', (None, None)),
+    (None, (None, None)),
+])
+def test_parse_watering_frequency(text, expected):
+    assert parse_watering_frequency(text) == expected
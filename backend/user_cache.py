@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import select
+from model import db, User, Plants, plant_owner
+
+
+class CachedUser:
+    """Identity resolved from a JWT; the ORM row is only loaded on first use of `.model`."""
+
+    def __init__(self, id, username, email):
+        self.id = id
+        self.username = username
+        self.email = email
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = db.session.get(User, self.id)
+        return self._model
+
+    def to_dict(self):
+        return user_payload(self, db.session.execute(owned_plants_query(self.id)))
+
+
+def owned_plants_query(user_id):
+    return select(Plants.id, Plants.nickname)\
+        .join(plant_owner, plant_owner.c.plant_id == Plants.id)\
+        .where(plant_owner.c.user_id == user_id)\
+        .order_by(Plants.id)
+
+
+def user_payload(user, plants):
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'plants': [{'id': plant.id, 'nickname': plant.nickname} for plant in plants]
+    }
+
+
+class UserCache:
+    """Size-bounded LRU of resolved identities keyed on (user_id, iat), with a short TTL."""
+
+    def __init__(self, ttl=60, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config['USER_CACHE_TTL']
+        self.maxsize = app.config['USER_CACHE_SIZE']
+        self.clear()
+
+    def get(self, user_id, iat):
+        cached = self.lookup(user_id, iat)
+        if cached:
+            return cached
+
+        user = db.session.get(User, user_id)
+        if not user:
+            return None
+        cached = self.store(user, iat)
+        cached._model = user
+        return cached
+
+    def lookup(self, user_id, iat):
+        # Cache-only half of get(), for callers that load the User themselves (e.g. async sessions)
+        key = (user_id, iat)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return CachedUser(*entry[1])
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def store(self, user, iat):
+        key = (user.id, iat)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, (user.id, user.username, user.email))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return CachedUser(user.id, user.username, user.email)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
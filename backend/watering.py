@@ -0,0 +1,95 @@
+import re
+
+UNIT_DAYS = {
+    'day': 1,
+    'week': 7,
+    'month': 30,
+    'year': 365,
+}
+
+WORD_NUMBERS = {
+    'a': 1, 'an': 1, 'one': 1, 'once': 1, 'two': 2, 'twice': 2, 'three': 3, 'thrice': 3,
+    'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+}
+
+ADVERBS = {
+    'daily': (1, 1),
+    'weekly': (7, 7),
+    'biweekly': (14, 14),
+    'bi-weekly': (14, 14),
+    'fortnightly': (14, 14),
+    'monthly': (30, 30),
+    'bimonthly': (60, 60),
+    'bi-monthly': (60, 60),
+}
+
+NUMBER = r'\b(\d+(?:\.\d+)?|(?:' + '|'.join(WORD_NUMBERS) + r')\b)'
+UNIT = r'\b(day|week|month|year)s?\b'
+
+EVERY_OTHER_DAY = re.compile(r'\bevery other day\b')
+# "twice a week", "2-3 times per week", "3x a month"
+FREQUENCY = re.compile(rf'(?:{NUMBER}\s*(?:-|to|or)\s*)?{NUMBER}\s*(?:times|x)?\s*(?:a|per|each|every)\s+{UNIT}')
+# Longest first so "biweekly" isn't read as "weekly"
+ADVERB = re.compile(r'\b(' + '|'.join(re.escape(word) for word in sorted(ADVERBS, key=len, reverse=True)) + r')\b')
+# "every 2-3 weeks", "every 10 days", "1-2 weeks", "every week"
+INTERVAL = re.compile(rf'(every\s+)?(?:{NUMBER}\s*(?:-|to|or)\s*)?{NUMBER}?\s*\b(day|week|month|year)(s?)\b')
+
+
+def _number(value):
+    if value is None:
+        return None
+    return WORD_NUMBERS.get(value) or float(value)
+
+
+def _frequency_interval(match):
+    low, high, unit = _number(match.group(1)), _number(match.group(2)), UNIT_DAYS[match.group(3)]
+    low = low or high
+    # More waterings per period means a shorter interval
+    return max(1, round(unit / max(low, high))), max(1, round(unit / min(low, high)))
+
+
+def _explicit_interval(match):
+    every, low, high, unit, plural = match.groups()
+    low, high = _number(low), _number(high)
+    if high is None:
+        # Only "every week" implies a count of one; "every few days" or a bare "days" says nothing
+        if not every or plural:
+            return None
+        high = 1
+    low = low or high
+    unit = UNIT_DAYS[unit]
+    return max(1, round(min(low, high) * unit)), max(1, round(max(low, high) * unit))
+
+
+PATTERNS = (
+    (EVERY_OTHER_DAY, lambda match: (2, 2)),
+    (FREQUENCY, _frequency_interval),
+    (ADVERB, lambda match: ADVERBS[match.group(1)]),
+    (INTERVAL, _explicit_interval),
+)
+
+
+def parse_watering_frequency(text):
+    """Turn free-text watering advice into a (min_days, max_days) interval, or (None, None).
+
+    Every phrase found counts, so "every 2 weeks in summer, monthly in winter" spans 14-30 days.
+    """
+    if not text:
+        return None, None
+
+    text = text.strip().lower()
+    intervals = []
+
+    def consume(match, convert):
+        interval = convert(match)
+        if interval is not None:
+            intervals.append(interval)
+        # Blank the phrase out so later patterns don't read "a week" out of "twice a week"
+        return ' ' * len(match.group())
+
+    for pattern, convert in PATTERNS:
+        text = pattern.sub(lambda match: consume(match, convert), text)
+
+    if not intervals:
+        return None, None
+    return min(low for low, _ in intervals), max(high for _, high in intervals)